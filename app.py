@@ -12,9 +12,19 @@ Tarih: 2024
 from __future__ import annotations
 
 import base64
+import hashlib
+import json
+import math
+import re
+import secrets
+import struct
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, NamedTuple, Optional
 
 # Şifreleme kütüphaneleri
 from Crypto.Cipher import AES, DES, PKCS1_OAEP
@@ -23,6 +33,7 @@ from Crypto.Random import get_random_bytes
 from Crypto.Signature import DSS
 from Crypto.Hash import SHA256
 from Crypto.Util.Padding import pad, unpad
+from Crypto.Util import _cpu_features
 
 # Web framework
 from flask import Flask, render_template, request, jsonify
@@ -32,10 +43,71 @@ from flask import Flask, render_template, request, jsonify
 app = Flask(__name__)
 
 
+# pycryptodome, işlemci destekliyorsa AES için AES-NI komutlarını
+# kullanabilir; desteklenmiyorsa yazılım implementasyonuna düşer. CPU bir
+# kez, modül yüklenirken sorgulanır ve sonuç AES.new çağrılarına
+# use_aesni parametresi olarak aktarılır.
+AES_NI_AVAILABLE = bool(_cpu_features.have_aes_ni())
+if not AES_NI_AVAILABLE:
+  app.logger.warning("AES-NI desteklenmiyor; AES yazılım implementasyonu ile çalışacak.")
+
+# Kütüphanesiz DSA/ECC anahtar ve nonce üretimi için işletim sisteminin
+# kriptografik rastgele kaynağı (random modülünün paylaşılan, tahmin
+# edilebilir durumu yerine)
+SECURE_RANDOM = secrets.SystemRandom()
+
+# Kütüphaneli AES durum mesajında donanım hızlandırması da belirtilir; böylece
+# kütüphanesiz (XOR tabanlı) sürümle süre karşılaştırması doğru yorumlanır.
+AES_LIBRARY_LABEL = "kütüphaneli, AES-NI" if AES_NI_AVAILABLE else "kütüphaneli"
+
+
 # -----------------------------
 #  ŞİFRELEME ALGORİTMALARI
 # -----------------------------
 
+# ASCII harf olmayan tüm byte'lar (bytes.translate silme tablosu)
+ASCII_NON_ALPHA = bytes(b for b in range(256) if not chr(b).isalpha() or b >= 128)
+
+
+def letters_only(text: str) -> str:
+  """
+  Metinden yalnızca harfleri bırakır.
+  
+  ASCII metinlerde tek bir C seviyesinde bytes.translate geçişi kullanılır;
+  diğer metinlerde Unicode harfleri korumak için str.isalpha ile süzülür.
+  
+  Args:
+    text: Süzülecek metin
+  
+  Returns:
+    Yalnızca harflerden oluşan metin
+  """
+  if text.isascii():
+    return text.encode("ascii").translate(None, ASCII_NON_ALPHA).decode("ascii")
+  return "".join(filter(str.isalpha, text))
+
+
+def letters_fill_runs(parts: list[str], letters: str) -> str:
+  """
+  re.split(r"([^A-Za-z]+)", ...) ile ayrılmış metnin harf bloklarını
+  verilen harflerle sırayla değiştirip metni yeniden birleştirir.
+  
+  Blok sınırları uzunlukların kümülatif toplamından tek seferde
+  hesaplanır; harf olmayan parçalar olduğu gibi kalır.
+  
+  Args:
+    parts: Çift indekslerde harf blokları, tek indekslerde diğer
+      parçalar bulunan liste (yerinde değiştirilir)
+    letters: Harf bloklarının yerine sırayla konacak harfler
+  
+  Returns:
+    Orijinal düzende yeniden birleştirilmiş metin
+  """
+  ends = list(accumulate(map(len, parts[0::2])))
+  parts[0::2] = map(letters.__getitem__, map(slice, [0] + ends[:-1], ends))
+  return "".join(parts)
+
+
 # -----------------------------
 #  SEZAR ŞİFRELEMESİ
 # -----------------------------
@@ -70,6 +142,40 @@ def caesar_shift_char(ch: str, shift: int) -> str:
   return ch
 
 
+# Yalnızca 26 farklı kaydırma olduğu için tüm str.translate tabloları
+# modül yüklenirken bir kez oluşturulur
+ASCII_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ASCII_LOWER = "abcdefghijklmnopqrstuvwxyz"
+CAESAR_TABLES = tuple(
+  str.maketrans(
+    ASCII_UPPER + ASCII_LOWER,
+    ASCII_UPPER[offset:] + ASCII_UPPER[:offset] + ASCII_LOWER[offset:] + ASCII_LOWER[:offset],
+  )
+  for offset in range(26)
+)
+# Aynı kaydırmaların yalnızca ASCII harf içeren bytes için karşılıkları
+CAESAR_BYTE_TABLES = tuple(
+  bytes.maketrans(
+    (ASCII_UPPER + ASCII_LOWER).encode("ascii"),
+    (ASCII_UPPER[offset:] + ASCII_UPPER[:offset] + ASCII_LOWER[offset:] + ASCII_LOWER[:offset]).encode("ascii"),
+  )
+  for offset in range(26)
+)
+
+
+def caesar_table(shift: int) -> dict[int, int]:
+  """
+  Sezar kaydırması için str.translate tablosunu döndürür.
+  
+  Args:
+    shift: Kaydırma miktarı (herhangi bir tam sayı, mod 26 alınır)
+  
+  Returns:
+    A-Z ve a-z harflerini kaydırılmış karşılıklarına eşleyen tablo
+  """
+  return CAESAR_TABLES[shift % 26]
+
+
 def caesar_encrypt(text: str, shift: int) -> str:
   """
   Sezar şifrelemesi ile metni şifreler.
@@ -83,7 +189,10 @@ def caesar_encrypt(text: str, shift: int) -> str:
   Returns:
     Şifrelenmiş metin
   """
-  return "".join(caesar_shift_char(ch, shift) for ch in text)
+  # Karakter başına fonksiyon çağrısı yerine tek seferde str.translate
+  # kullanılır; döngü C seviyesinde çalışır, ASCII dışı karakterler
+  # tabloda olmadığı için olduğu gibi kalır.
+  return text.translate(caesar_table(shift))
 
 
 def caesar_decrypt(text: str, shift: int) -> str:
@@ -114,6 +223,11 @@ def rail_fence_encrypt(text: str, rails: int) -> str:
   Metni zikzak bir desenle 'rails' sayıda katmana yerleştirir
   ve her katmandaki karakterleri sırayla okur.
   
+  Zikzak deseni 2 * (rails - 1) uzunluğunda tekrar ettiği için
+  her katman, metnin sabit adımlı dilimleriyle doğrudan okunur:
+  ilk ve son katman tek bir dilimdir, aradaki katmanlar ise
+  "iniş" ve "çıkış" dilimlerinin sırayla birleşimidir.
+  
   Args:
     text: Şifrelenecek metin
     rails: Kullanılacak katman (rail) sayısı (minimum 2)
@@ -125,25 +239,25 @@ def rail_fence_encrypt(text: str, rails: int) -> str:
   if rails < 2 or len(text) == 0:
     return text
 
-  # Her katman için boş liste oluştur
-  lines = [[] for _ in range(rails)]
-  row = 0  # Mevcut katman
-  direction = 1  # 1: aşağı yön, -1: yukarı yön
-
-  # Metindeki her karakteri uygun katmana yerleştir
-  for ch in text:
-    lines[row].append(ch)
+  cycle = 2 * (rails - 1)  # Zikzak periyodu
+  lines = []
 
-    # Yön değişikliği: en üstteyse aşağı, en alttaysa yukarı
-    if row == 0:
-      direction = 1
-    elif row == rails - 1:
-      direction = -1
-
-    row += direction
+  # Metinden uzun katmanlar boş kalır, yalnızca dolu katmanları oku
+  for r in range(min(rails, len(text))):
+    if r == 0 or r == rails - 1:
+      # İlk ve son katman: her periyotta tek karakter
+      lines.append(text[r::cycle])
+    else:
+      # Ara katman: iniş (r) ve çıkış (cycle - r) karakterleri sırayla
+      down = text[r::cycle]
+      up = text[cycle - r::cycle]
+      merged = [""] * (len(down) + len(up))
+      merged[0::2] = down
+      merged[1::2] = up
+      lines.append("".join(merged))
 
   # Tüm katmanları birleştir ve şifrelenmiş metni döndür
-  return "".join("".join(line) for line in lines)
+  return "".join(lines)
 
 
 def rail_fence_decrypt(cipher: str, rails: int) -> str:
@@ -151,6 +265,8 @@ def rail_fence_decrypt(cipher: str, rails: int) -> str:
   Rail Fence şifrelemesi ile şifrelenmiş metni çözer.
   
   Şifreleme işleminin tersini yaparak orijinal metni geri getirir.
+  Her katmanın şifreli metindeki parçası, şifrelemede okunduğu
+  dilimlere geri yazılır.
   
   Args:
     cipher: Çözülecek şifrelenmiş metin
@@ -164,41 +280,22 @@ def rail_fence_decrypt(cipher: str, rails: int) -> str:
     return cipher
 
   length = len(cipher)
-
-  # Her katmana kaç karakter düşeceğini hesapla
-  # Şifreleme sırasındaki zikzak desenini simüle et
-  counts = [0] * rails
-  row = 0
-  direction = 1
-
-  for _ in range(length):
-    counts[row] += 1
-    if row == 0:
-      direction = 1
-    elif row == rails - 1:
-      direction = -1
-    row += direction
-
-  # Şifrelenmiş metni katmanlara göre paylaştır
-  rails_arr = []
+  cycle = 2 * (rails - 1)  # Zikzak periyodu
+  result = [""] * length
   index = 0
-  for r in range(rails):
-    part = list(cipher[index : index + counts[r]])
-    rails_arr.append(part)
-    index += counts[r]
-
-  # Zigzag sırasıyla karakterleri oku ve orijinal metni oluştur
-  result = []
-  row = 0
-  direction = 1
 
-  for _ in range(length):
-    result.append(rails_arr[row].pop(0))
-    if row == 0:
-      direction = 1
-    elif row == rails - 1:
-      direction = -1
-    row += direction
+  for r in range(min(rails, length)):
+    if r == 0 or r == rails - 1:
+      # İlk ve son katman: parçayı doğrudan dilime yaz
+      count = len(range(r, length, cycle))
+      result[r::cycle] = cipher[index:index + count]
+    else:
+      # Ara katman: parça iniş ve çıkış dilimlerine sırayla dağıtılır
+      count = len(range(r, length, cycle)) + len(range(cycle - r, length, cycle))
+      part = cipher[index:index + count]
+      result[r::cycle] = part[0::2]
+      result[cycle - r::cycle] = part[1::2]
+    index += count
 
   return "".join(result)
 
@@ -208,6 +305,41 @@ def rail_fence_decrypt(cipher: str, rails: int) -> str:
 # -----------------------------
 
 
+def repeat_to_length(seq, length: int):
+  """
+  Bir string veya byte dizisini tam olarak 'length' uzunluğa kadar tekrarlar.
+  
+  (seq * (n + 1))[:length] kalıbı önce fazladan uzun bir kopya oluşturup
+  sonra onu dilimler; burada sonuç tek bir birleştirme ile doğrudan
+  istenen uzunlukta üretilir.
+  
+  Args:
+    seq: Tekrarlanacak boş olmayan str veya bytes
+    length: İstenen uzunluk
+  
+  Returns:
+    seq ile aynı türde, 'length' uzunluğunda dizi
+  """
+  full, rest = divmod(length, len(seq))
+  return seq * full + seq[:rest]
+
+
+@lru_cache(maxsize=256)
+def vigenere_clean_key(key: str) -> str:
+  """
+  Vigenere anahtarından yalnızca harfleri alıp büyük harfe çevirir.
+  
+  Aynı anahtarla yapılan ardışık isteklerde temizleme tekrarlanmaz.
+  
+  Args:
+    key: Anahtar kelime
+  
+  Returns:
+    Büyük harfli anahtar; harf yoksa varsayılan "A"
+  """
+  return letters_only(key).upper() or "A"
+
+
 def vigenere_prepare_key(key: str, length: int) -> str:
   """
   Vigenere şifrelemesi için anahtarı hazırlar.
@@ -222,14 +354,48 @@ def vigenere_prepare_key(key: str, length: int) -> str:
   Returns:
     Hazırlanmış ve tekrarlanmış anahtar
   """
-  # Anahtardan yalnızca harfleri al ve büyük harfe çevir
-  key_clean = "".join(ch.upper() for ch in key if ch.isalpha())
-  # Boşsa varsayılan anahtar kullan
-  if not key_clean:
-    key_clean = "A"
-  # Anahtarı metin uzunluğuna kadar tekrarla
-  key_repeated = (key_clean * ((length // len(key_clean)) + 1))[:length]
-  return key_repeated
+  # Temizlenmiş anahtarı metin uzunluğuna kadar tekrarla
+  return repeat_to_length(vigenere_clean_key(key), length)
+
+
+def vigenere_translate(text: str, key: str, direction: int) -> str:
+  """
+  Vigenere kaydırmasını metnin tamamına toplu uygular.
+  
+  Metindeki harfler tek bir bytes dizisinde toplanır; anahtarın her
+  harfi için o harfe düşen konumlar (letters[j::len(key)]) tek bir
+  bytes.translate çağrısıyla kaydırılıp bytearray'e strided dilim
+  olarak yazılır. Harf olmayan parçalar daha sonra orijinal yerlerine
+  geri yerleştirilir.
+  
+  Yalnızca İngilizce alfabedeki harfler (A-Z, a-z) kaydırılır ve
+  anahtar harfi tüketir; diğer tüm karakterler (Türkçe harfler dahil)
+  olduğu gibi kalır.
+  
+  Args:
+    text: İşlenecek metin
+    key: Anahtar kelime
+    direction: 1 şifreleme, -1 deşifreleme için
+  
+  Returns:
+    Kaydırılmış metin
+  """
+  key_clean = vigenere_clean_key(key)
+
+  # Metni harf blokları ve aradaki harf olmayan parçalar olarak ayır
+  parts = re.split(r"([^A-Za-z]+)", text)
+  # Harf blokları yalnızca A-Z / a-z içerdiğinden bytes olarak işlenebilir
+  letters = "".join(parts[0::2]).encode("ascii")
+
+  # Anahtarın her konumu için ilgili harfleri tek seferde kaydır
+  key_len = len(key_clean)
+  shifted = bytearray(letters)
+  for j, key_ch in enumerate(key_clean[:len(letters)]):
+    table = CAESAR_BYTE_TABLES[direction * (ord(key_ch) - ord("A")) % 26]
+    shifted[j::key_len] = letters[j::key_len].translate(table)
+
+  # Harf bloklarını orijinal uzunluklarına göre yerine koy
+  return letters_fill_runs(parts, shifted.decode("ascii"))
 
 
 def vigenere_encrypt(text: str, key: str) -> str:
@@ -249,29 +415,8 @@ def vigenere_encrypt(text: str, key: str) -> str:
   if not key:
     return text
 
-  # Anahtarı metin uzunluğuna kadar hazırla
-  key_prepared = vigenere_prepare_key(key, len(text))
-  result = []
-
-  key_idx = 0
-  for ch in text:
-    if ch.isalpha():
-      # Harfin büyük/küçük durumunu koru
-      is_upper = ch.isupper()
-      ch_code = ord(ch.upper())
-      key_code = ord(key_prepared[key_idx].upper())
-      # Anahtar harfinden kaydırma miktarını hesapla
-      shift = key_code - ord("A")
-      
-      # Sezar şifrelemesi benzeri kaydırma uygula
-      new_code = ((ch_code - ord("A") + shift) % 26) + ord("A")
-      result.append(chr(new_code) if is_upper else chr(new_code).lower())
-      key_idx += 1
-    else:
-      # Alfabetik olmayan karakterler olduğu gibi kalır
-      result.append(ch)
-
-  return "".join(result)
+  # Harfler anahtar konumlarına göre gruplanıp str.translate ile kaydırılır
+  return vigenere_translate(text, key, 1)
 
 
 def vigenere_decrypt(cipher: str, key: str) -> str:
@@ -290,29 +435,8 @@ def vigenere_decrypt(cipher: str, key: str) -> str:
   if not key:
     return cipher
 
-  # Anahtarı metin uzunluğuna kadar hazırla
-  key_prepared = vigenere_prepare_key(key, len(cipher))
-  result = []
-
-  key_idx = 0
-  for ch in cipher:
-    if ch.isalpha():
-      # Harfin büyük/küçük durumunu koru
-      is_upper = ch.isupper()
-      ch_code = ord(ch.upper())
-      key_code = ord(key_prepared[key_idx].upper())
-      # Anahtar harfinden kaydırma miktarını hesapla
-      shift = key_code - ord("A")
-      
-      # Ters kaydırma uygula (şifrelemenin tersi)
-      new_code = ((ch_code - ord("A") - shift + 26) % 26) + ord("A")
-      result.append(chr(new_code) if is_upper else chr(new_code).lower())
-      key_idx += 1
-    else:
-      # Alfabetik olmayan karakterler olduğu gibi kalır
-      result.append(ch)
-
-  return "".join(result)
+  # Harfler anahtar konumlarına göre gruplanıp str.translate ile kaydırılır
+  return vigenere_translate(cipher, key, -1)
 
 
 # -----------------------------
@@ -320,49 +444,103 @@ def vigenere_decrypt(cipher: str, key: str) -> str:
 # -----------------------------
 
 
+@lru_cache(maxsize=256)
+def xor_table(key_byte: int) -> bytes:
+  """
+  Tek bir anahtar byte'ı ile XOR için bytes.translate tablosu oluşturur.
+  
+  Args:
+    key_byte: 0-255 arası anahtar byte'ı
+  
+  Returns:
+    i -> i ^ key_byte eşlemesini tutan 256 byte'lık tablo
+  """
+  return bytes(i ^ key_byte for i in range(256))
+
+
+def xor_bytes(data: bytes, key: bytes) -> bytes:
+  """
+  Veriyi, tekrarlanan anahtar ile XOR işlemine tabi tutar.
+  
+  Byte'lar tek tek işlenmek yerine iki büyük tam sayıya çevrilir
+  ve tek bir XOR işlemi yapılır; döngü C seviyesinde çalışır.
+  Anahtara göre uzun verilerde ise her anahtar byte'ının düştüğü
+  dilim (data[j::len(key)]) tek bir bytes.translate ile XOR'lanır;
+  bu tablo araması büyük tam sayı dönüşümlerinden daha hızlıdır.
+  
+  Args:
+    data: İşlenecek byte dizisi
+    key: Anahtar byte'ları (veri uzunluğuna kadar tekrarlanır)
+  
+  Returns:
+    data ile aynı uzunlukta XOR sonucu
+  """
+  length = len(data)
+  if length == 0:
+    return b""
+  key_len = len(key)
+  # Anahtar byte'ı başına ~1 KB veri varsa dilim başına translate daha hızlı
+  if length >= 1024 * key_len:
+    result = bytearray(length)
+    for j, key_byte in enumerate(key):
+      result[j::key_len] = data[j::key_len].translate(xor_table(key_byte))
+    return bytes(result)
+  key_extended = repeat_to_length(key, length)
+  xored = int.from_bytes(data, "big") ^ int.from_bytes(key_extended, "big")
+  return xored.to_bytes(length, "big")
+
+
 def vernam_encrypt(text: str, key: str) -> str:
   """
   Vernam (One-Time Pad) şifrelemesi ile metni şifreler.
   
-  XOR işlemi kullanarak karakter bazlı şifreleme yapar.
+  XOR işlemi kullanarak byte bazlı şifreleme yapar.
   Teorik olarak kırılamaz bir şifreleme yöntemidir.
   
+  XOR sonucu yazdırılamayan karakterler (hatta geçersiz surrogate
+  kod noktaları) üretebildiği için çıktı Base64 ile kodlanır.
+  
   Args:
     text: Şifrelenecek metin
     key: Anahtar (One-Time Pad için metinle aynı uzunlukta olmalı)
   
   Returns:
-    Şifrelenmiş metin (binary format)
+    Base64 kodlanmış şifrelenmiş metin
   """
   if not key:
     return text
 
-  # Anahtarı metin uzunluğuna kadar tekrarla
-  key_extended = (key * ((len(text) // len(key)) + 1))[:len(text)]
-  
-  result = []
-  for i, ch in enumerate(text):
-    # Her karakteri anahtar karakteri ile XOR işlemine tabi tut
-    encrypted_char = chr(ord(ch) ^ ord(key_extended[i]))
-    result.append(encrypted_char)
-
-  return "".join(result)
+  # Metin ve anahtar UTF-8 byte'ları üzerinde XOR işlemi
+  encrypted = xor_bytes(text.encode('utf-8'), key.encode('utf-8'))
+  return base64.b64encode(encrypted).decode('ascii')
 
 
 def vernam_decrypt(cipher: str, key: str) -> str:
   """
   Vernam şifrelemesi ile şifrelenmiş metni çözer.
   
-  XOR işlemi simetrik olduğu için şifreleme ile aynı işlemi yapar.
+  XOR işlemi simetrik olduğu için Base64 çözüldükten sonra
+  şifreleme ile aynı işlem yapılır.
   
   Args:
-    cipher: Çözülecek şifrelenmiş metin
+    cipher: Çözülecek Base64 kodlanmış şifrelenmiş metin
     key: Kullanılan anahtar
   
   Returns:
     Çözülmüş orijinal metin
+  
+  Raises:
+    ValueError: Base64 veya UTF-8 çözme hatası oluşursa
   """
-  return vernam_encrypt(cipher, key)
+  if not key:
+    return cipher
+
+  try:
+    encrypted = base64.b64decode(cipher)
+    decrypted = xor_bytes(encrypted, key.encode('utf-8'))
+    return decrypted.decode('utf-8')
+  except Exception as e:
+    raise ValueError(f"Vernam deşifreleme hatası: {str(e)}")
 
 
 # -----------------------------
@@ -388,7 +566,7 @@ def playfair_prepare_text(text: str) -> str:
     Çift harfli gruplar halinde hazırlanmış metin
   """
   # Yalnızca harfleri al ve büyük harfe çevir
-  text_clean = "".join(ch.upper() for ch in text if ch.isalpha())
+  text_clean = letters_only(text).upper()
   # J harflerini I ile değiştir (Playfair 5x5 matrisinde J yoktur)
   text_clean = text_clean.replace("J", "I")
   
@@ -416,7 +594,8 @@ def playfair_prepare_text(text: str) -> str:
   return " ".join(result)
 
 
-def playfair_create_matrix(key: str) -> list[list[str]]:
+@lru_cache(maxsize=256)
+def playfair_create_matrix(key: str) -> str:
   """
   5x5 Playfair matrisi oluşturur.
   
@@ -427,57 +606,59 @@ def playfair_create_matrix(key: str) -> list[list[str]]:
     key: Anahtar kelime
   
   Returns:
-    5x5 karakter matrisi (J harfi kullanılmaz, I kullanılır)
+    Satır satır düzleştirilmiş 25 karakterlik matris; (satır, sütun)
+    hücresi matrix[satır * 5 + sütun] konumundadır
+    (J harfi kullanılmaz, I kullanılır)
   """
   # Anahtardan yalnızca harfleri al, J'yi I ile değiştir
-  key_clean = "".join(ch.upper() for ch in key if ch.isalpha()).replace("J", "I")
-  
-  # Tekrar eden harfleri kaldır (set kullanarak)
-  seen = set()
-  key_unique = ""
-  for ch in key_clean:
-    if ch not in seen:
-      key_unique += ch
-      seen.add(ch)
-  
-  # Kalan alfabeyi hazırla (J hariç, 25 harf)
-  alphabet = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
-  # Anahtardaki harfleri alfabeden çıkar
-  for ch in key_unique:
-    alphabet = alphabet.replace(ch, "")
-  
-  # Anahtar + kalan alfabe = 25 karakter
-  matrix_str = key_unique + alphabet
-  matrix = []
-  # 5x5 matris oluştur
-  for i in range(5):
-    row = []
-    for j in range(5):
-      row.append(matrix_str[i * 5 + j])
-    matrix.append(row)
+  key_clean = letters_only(key).upper().replace("J", "I")
   
-  return matrix
+  # Anahtar + alfabe (J hariç, 25 harf) tek geçişte tekilleştirilir:
+  # dict.fromkeys ilk görülme sırasını koruduğu için önce anahtar harfleri,
+  # ardından anahtarda olmayan alfabe harfleri gelir.
+  # İç içe listeler yerine tek bir düz string tutulur; her erişim
+  # tek bir indeksleme ile yapılır.
+  return "".join(dict.fromkeys(key_clean + "ABCDEFGHIKLMNOPQRSTUVWXYZ"))[:25]
 
 
-def playfair_find_position(matrix: list[list[str]], ch: str) -> tuple[int, int]:
+def playfair_find_position(matrix: str, ch: str) -> tuple[int, int]:
   """
   Playfair matrisinde bir harfin pozisyonunu bulur.
   
   Args:
-    matrix: 5x5 Playfair matrisi
+    matrix: Düzleştirilmiş 5x5 Playfair matrisi
     ch: Aranacak harf
   
   Returns:
     (satır, sütun) tuple'ı, bulunamazsa (0, 0)
   """
-  for i in range(5):
-    for j in range(5):
-      if matrix[i][j] == ch:
-        return (i, j)
-  return (0, 0)
+  idx = matrix.find(ch)
+  if idx == -1:
+    return (0, 0)
+  return divmod(idx, 5)
+
+
+@lru_cache(maxsize=256)
+def playfair_build_positions(matrix: str) -> dict[str, tuple[int, int]]:
+  """
+  Playfair matrisindeki her harfin pozisyonunu tek seferde çıkarır.
+  
+  Her çift için matrisi taramak yerine bu tablo bir kez oluşturulur
+  ve harf pozisyonları sabit zamanlı sözlük aramasıyla bulunur.
+  
+  Args:
+    matrix: Düzleştirilmiş 5x5 Playfair matrisi
+  
+  Returns:
+    harf -> (satır, sütun) sözlüğü (önbellekte paylaşıldığı için
+    salt okunur kullanılmalıdır)
+  """
+  return {ch: divmod(idx, 5) for idx, ch in enumerate(matrix)}
 
 
-def playfair_encrypt_pair(matrix: list[list[str]], pair: str) -> str:
+def playfair_encrypt_pair(
+  matrix: str, positions: dict[str, tuple[int, int]], pair: str
+) -> str:
   """
   Playfair matrisinde iki harfli çifti şifreler.
   
@@ -487,7 +668,8 @@ def playfair_encrypt_pair(matrix: list[list[str]], pair: str) -> str:
   3. Dikdörtgen oluşturuyorsa: köşeleri değiştir
   
   Args:
-    matrix: 5x5 Playfair matrisi
+    matrix: Düzleştirilmiş 5x5 Playfair matrisi
+    positions: playfair_build_positions ile oluşturulan pozisyon tablosu
     pair: Şifrelenecek iki harfli çift
   
   Returns:
@@ -497,26 +679,28 @@ def playfair_encrypt_pair(matrix: list[list[str]], pair: str) -> str:
     return pair
   
   ch1, ch2 = pair[0], pair[1]
-  # Her harfin matristeki pozisyonunu bul
-  row1, col1 = playfair_find_position(matrix, ch1)
-  row2, col2 = playfair_find_position(matrix, ch2)
+  # Her harfin matristeki pozisyonunu bul (matriste yoksa (0, 0))
+  row1, col1 = positions.get(ch1, (0, 0))
+  row2, col2 = positions.get(ch2, (0, 0))
   
   if row1 == row2:
     # Aynı satırda: sağa kaydır (modüler aritmetik ile sarmal)
     new_col1 = (col1 + 1) % 5
     new_col2 = (col2 + 1) % 5
-    return matrix[row1][new_col1] + matrix[row2][new_col2]
+    return matrix[row1 * 5 + new_col1] + matrix[row2 * 5 + new_col2]
   elif col1 == col2:
     # Aynı sütunda: aşağı kaydır (modüler aritmetik ile sarmal)
     new_row1 = (row1 + 1) % 5
     new_row2 = (row2 + 1) % 5
-    return matrix[new_row1][col1] + matrix[new_row2][col2]
+    return matrix[new_row1 * 5 + col1] + matrix[new_row2 * 5 + col2]
   else:
     # Dikdörtgen: köşeleri değiştir (satır/sütun değişimi)
-    return matrix[row1][col2] + matrix[row2][col1]
+    return matrix[row1 * 5 + col2] + matrix[row2 * 5 + col1]
 
 
-def playfair_decrypt_pair(matrix: list[list[str]], pair: str) -> str:
+def playfair_decrypt_pair(
+  matrix: str, positions: dict[str, tuple[int, int]], pair: str
+) -> str:
   """
   Playfair matrisinde iki harfli çifti deşifreler.
   
@@ -526,7 +710,8 @@ def playfair_decrypt_pair(matrix: list[list[str]], pair: str) -> str:
   3. Dikdörtgen oluşturuyorsa: köşeleri değiştir (aynı işlem)
   
   Args:
-    matrix: 5x5 Playfair matrisi
+    matrix: Düzleştirilmiş 5x5 Playfair matrisi
+    positions: playfair_build_positions ile oluşturulan pozisyon tablosu
     pair: Çözülecek iki harfli çift
   
   Returns:
@@ -536,23 +721,49 @@ def playfair_decrypt_pair(matrix: list[list[str]], pair: str) -> str:
     return pair
   
   ch1, ch2 = pair[0], pair[1]
-  # Her harfin matristeki pozisyonunu bul
-  row1, col1 = playfair_find_position(matrix, ch1)
-  row2, col2 = playfair_find_position(matrix, ch2)
+  # Her harfin matristeki pozisyonunu bul (matriste yoksa (0, 0))
+  row1, col1 = positions.get(ch1, (0, 0))
+  row2, col2 = positions.get(ch2, (0, 0))
   
   if row1 == row2:
     # Aynı satırda: sola kaydır (şifrelemenin tersi)
     new_col1 = (col1 - 1) % 5
     new_col2 = (col2 - 1) % 5
-    return matrix[row1][new_col1] + matrix[row2][new_col2]
+    return matrix[row1 * 5 + new_col1] + matrix[row2 * 5 + new_col2]
   elif col1 == col2:
     # Aynı sütunda: yukarı kaydır (şifrelemenin tersi)
     new_row1 = (row1 - 1) % 5
     new_row2 = (row2 - 1) % 5
-    return matrix[new_row1][col1] + matrix[new_row2][col2]
+    return matrix[new_row1 * 5 + col1] + matrix[new_row2 * 5 + col2]
   else:
     # Dikdörtgen: köşeleri değiştir (şifreleme ve deşifreleme aynı)
-    return matrix[row1][col2] + matrix[row2][col1]
+    return matrix[row1 * 5 + col2] + matrix[row2 * 5 + col1]
+
+
+@lru_cache(maxsize=256)
+def playfair_pair_table(matrix: str, decrypt: bool = False) -> dict[str, str]:
+  """
+  Matristeki 25 x 25 = 625 olası harf çiftinin sonucunu önceden hesaplar.
+  
+  Matris sabitken her çiftin sonucu belirlidir; tablo bir kez kurulduktan
+  sonra her çift aynı satır / aynı sütun / dikdörtgen ayrımı yapılmadan
+  tek bir sözlük aramasıyla dönüştürülür.
+  
+  Args:
+    matrix: Düzleştirilmiş 5x5 Playfair matrisi
+    decrypt: True ise deşifreleme, False ise şifreleme tablosu
+  
+  Returns:
+    çift -> sonuç çifti sözlüğü (önbellekte paylaşıldığı için salt okunur
+    kullanılmalıdır)
+  """
+  positions = playfair_build_positions(matrix)
+  transform = playfair_decrypt_pair if decrypt else playfair_encrypt_pair
+  return {
+    ch1 + ch2: transform(matrix, positions, ch1 + ch2)
+    for ch1 in matrix
+    for ch2 in matrix
+  }
 
 
 def playfair_encrypt(text: str, key: str) -> str:
@@ -572,21 +783,20 @@ def playfair_encrypt(text: str, key: str) -> str:
   if not key or not text:
     return text
   
-  # 5x5 matris oluştur
+  # 5x5 matris, harf pozisyon tablosu ve çift tablosunu oluştur
   matrix = playfair_create_matrix(key)
+  positions = playfair_build_positions(matrix)
+  pair_table = playfair_pair_table(matrix)
   # Metni çiftlere ayır
   text_prepared = playfair_prepare_text(text)
   pairs = text_prepared.split()
   
-  # Her çifti şifrele
-  result = []
-  for pair in pairs:
-    if len(pair) == 2:
-      result.append(playfair_encrypt_pair(matrix, pair))
-    else:
-      result.append(pair)
-  
-  return "".join(result)
+  # Her çifti tablodan şifrele; matriste olmayan harf içeren çiftler
+  # (ör. Türkçe harfler) kurallarla tek tek işlenir
+  return "".join([
+    pair_table.get(pair) or playfair_encrypt_pair(matrix, positions, pair)
+    for pair in pairs
+  ])
 
 
 def playfair_decrypt(cipher: str, key: str) -> str:
@@ -605,62 +815,57 @@ def playfair_decrypt(cipher: str, key: str) -> str:
   if not key or not cipher:
     return cipher
   
-  # 5x5 matris oluştur
+  # 5x5 matris, harf pozisyon tablosu ve çift tablosunu oluştur
   matrix = playfair_create_matrix(key)
+  positions = playfair_build_positions(matrix)
+  pair_table = playfair_pair_table(matrix, decrypt=True)
   # Yalnızca harfleri al
-  cipher_clean = "".join(ch.upper() for ch in cipher if ch.isalpha())
+  cipher_clean = letters_only(cipher).upper()
   
   # Tek sayıda harf varsa X ekle
   if len(cipher_clean) % 2 != 0:
     cipher_clean += "X"
   
-  # Çiftlere ayır ve deşifrele
-  result = []
-  for i in range(0, len(cipher_clean), 2):
-    pair = cipher_clean[i:i+2]
-    if len(pair) == 2:
-      decrypted = playfair_decrypt_pair(matrix, pair)
-      result.append(decrypted)
-    else:
-      result.append(pair)
-  
-  return "".join(result)
+  # Çiftlere ayır ve tablodan deşifrele (uzunluk çift olduğundan her dilim
+  # iki harflidir); matriste olmayan harf içeren çiftler kurallarla işlenir
+  pairs = map(str.__add__, cipher_clean[0::2], cipher_clean[1::2])
+  return "".join([
+    pair_table.get(pair) or playfair_decrypt_pair(matrix, positions, pair)
+    for pair in pairs
+  ])
 
 
 # -----------------------------
 #  ROUTE ŞİFRELEMESİ
 # -----------------------------
 
-def route_encrypt(text: str, rows: int, cols: int, direction: str = "spiral") -> str:
-  """Route şifreleme - metni grid'e yerleştirip belirli rotada okur"""
-  if rows < 1 or cols < 1:
-    return text
-  
-  text_clean = "".join(ch for ch in text)
-  grid_size = rows * cols
+@lru_cache(maxsize=128)
+def route_spiral_order(rows: int, cols: int) -> tuple[int, ...]:
+  """
+  rows x cols grid'inin spiral okuma sırasını düz indeksler olarak döndürür.
   
-  # Metni grid'e yerleştir (kalan yerleri boşluk veya X ile doldur)
-  text_padded = text_clean.ljust(grid_size, "X")
+  Spiral sıra yalnızca grid boyutlarına bağlı olduğundan her
+  (rows, cols) için bir kez hesaplanır ve önbellekte tutulur.
   
-  # Grid oluştur
-  grid = []
-  for i in range(rows):
-    row = []
-    for j in range(cols):
-      row.append(text_padded[i * cols + j])
-    grid.append(row)
+  Args:
+    rows: Satır sayısı
+    cols: Sütun sayısı
   
-  # Spiral rotada oku (saat yönünde, dıştan içe)
-  result = []
-  visited = [[False for _ in range(cols)] for _ in range(rows)]
+  Returns:
+    Saat yönünde, dıştan içe ziyaret edilen hücrelerin
+    row * cols + col indeksleri
+  """
+  grid_size = rows * cols
+  order = []
+  visited = [False] * grid_size
   
   directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # sağ, aşağı, sol, yukarı
   dir_idx = 0
   row, col = 0, 0
   
   for _ in range(grid_size):
-    result.append(grid[row][col])
-    visited[row][col] = True
+    order.append(row * cols + col)
+    visited[row * cols + col] = True
     
     # Sonraki pozisyonu kontrol et
     next_row = row + directions[dir_idx][0]
@@ -669,14 +874,47 @@ def route_encrypt(text: str, rows: int, cols: int, direction: str = "spiral") ->
     # Eğer sınırları aşıyorsa veya ziyaret edilmişse yön değiştir
     if (next_row < 0 or next_row >= rows or 
         next_col < 0 or next_col >= cols or 
-        visited[next_row][next_col]):
+        visited[next_row * cols + next_col]):
       dir_idx = (dir_idx + 1) % 4
       next_row = row + directions[dir_idx][0]
       next_col = col + directions[dir_idx][1]
     
     row, col = next_row, next_col
   
-  return "".join(result)
+  return tuple(order)
+
+
+@lru_cache(maxsize=128)
+def route_spiral_inverse(rows: int, cols: int) -> tuple[int, ...]:
+  """
+  Spiral sıranın tersini döndürür (deşifreleme için).
+  
+  Args:
+    rows: Satır sayısı
+    cols: Sütun sayısı
+  
+  Returns:
+    Her grid hücresinin spiral sıradaki konumu
+  """
+  order = route_spiral_order(rows, cols)
+  inverse = [0] * len(order)
+  for spiral_pos, cell in enumerate(order):
+    inverse[cell] = spiral_pos
+  return tuple(inverse)
+
+
+def route_encrypt(text: str, rows: int, cols: int, direction: str = "spiral") -> str:
+  """Route şifreleme - metni grid'e yerleştirip belirli rotada okur"""
+  if rows < 1 or cols < 1:
+    return text
+  
+  grid_size = rows * cols
+  
+  # Metni grid'e yerleştir (kalan yerleri X ile doldur)
+  text_padded = text.ljust(grid_size, "X")
+  
+  # Spiral rotada oku (saat yönünde, dıştan içe)
+  return "".join([text_padded[i] for i in route_spiral_order(rows, cols)])
 
 
 def route_decrypt(cipher: str, rows: int, cols: int, direction: str = "spiral") -> str:
@@ -690,38 +928,10 @@ def route_decrypt(cipher: str, rows: int, cols: int, direction: str = "spiral")
   elif len(cipher) > grid_size:
     cipher = cipher[:grid_size]
   
-  # Grid oluştur
-  grid = [[None for _ in range(cols)] for _ in range(rows)]
-  visited = [[False for _ in range(cols)] for _ in range(rows)]
-  
-  # Şifreli metni spiral rotada grid'e yerleştir
-  directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-  dir_idx = 0
-  row, col = 0, 0
-  
-  for i, ch in enumerate(cipher):
-    grid[row][col] = ch
-    visited[row][col] = True
-    
-    if i < len(cipher) - 1:
-      next_row = row + directions[dir_idx][0]
-      next_col = col + directions[dir_idx][1]
-      
-      if (next_row < 0 or next_row >= rows or 
-          next_col < 0 or next_col >= cols or 
-          visited[next_row][next_col]):
-        dir_idx = (dir_idx + 1) % 4
-        next_row = row + directions[dir_idx][0]
-        next_col = col + directions[dir_idx][1]
-      
-      row, col = next_row, next_col
-  
-  # Grid'i normal şekilde oku (soldan sağa, yukarıdan aşağıya)
-  result = []
-  for i in range(rows):
-    for j in range(cols):
-      if grid[i][j]:
-        result.append(grid[i][j])
+  # Şifreli metin spiral sırayla yerleştirilmiş kabul edilir; grid'i
+  # normal şekilde (soldan sağa, yukarıdan aşağıya) okumak için her
+  # hücrenin spiral sıradaki karakteri alınır
+  result = [cipher[i] for i in route_spiral_inverse(rows, cols)]
   
   return "".join(result).rstrip("X")
 
@@ -743,14 +953,19 @@ def gcd_extended(a: int, b: int) -> tuple[int, int, int]:
   Returns:
     (gcd, x, y) tuple'ı, burada gcd = ax + by
   """
-  if a == 0:
-    return b, 0, 1
-  gcd, x1, y1 = gcd_extended(b % a, a)
-  x = y1 - (b // a) * x1
-  y = x1
-  return gcd, x, y
+  # Özyineleme yerine döngü: her adımda yeni bir çağrı çerçevesi açılmaz
+  old_r, r = a, b
+  old_x, x = 1, 0
+  old_y, y = 0, 1
+  while r:
+    q = old_r // r
+    old_r, r = r, old_r - q * r
+    old_x, x = x, old_x - q * x
+    old_y, y = y, old_y - q * y
+  return old_r, old_x, old_y
 
 
+@lru_cache(maxsize=256)
 def mod_inverse(a: int, m: int) -> int:
   """
   a sayısının mod m'deki modüler tersini bulur.
@@ -772,6 +987,32 @@ def mod_inverse(a: int, m: int) -> int:
   return (x % m + m) % m
 
 
+# 26 ile aralarında asal olan a değerleri ve mod 26'daki tersleri
+AFFINE_INVERSES = {
+  a: mod_inverse(a, 26) for a in range(1, 26) if mod_inverse(a, 26) is not None
+}
+
+
+@lru_cache(maxsize=1024)
+def affine_table(a: int, b: int) -> dict[int, int]:
+  """
+  Verilen harf dönüşümü için str.translate tablosu oluşturur.
+  
+  Affine tek alfabeli bir yer değiştirme olduğundan 26 harfin
+  karşılığı bir kez hesaplanır ve metnin tamamı tek bir
+  str.translate çağrısıyla dönüştürülür.
+  
+  Args:
+    a: Çarpan (harf pozisyonu ile çarpılır)
+    b: Toplanan değer
+  
+  Returns:
+    A-Z ve a-z harflerini (a * x + b) mod 26 karşılığına eşleyen tablo
+  """
+  mapped = "".join(chr((a * x + b) % 26 + ord("A")) for x in range(26))
+  return str.maketrans(ASCII_UPPER + ASCII_LOWER, mapped + mapped.lower())
+
+
 def affine_encrypt(text: str, a: int, b: int) -> str:
   """
   Affine şifreleme ile metni şifreler.
@@ -790,26 +1031,13 @@ def affine_encrypt(text: str, a: int, b: int) -> str:
   Raises:
     ValueError: a ve 26 aralarında asal değilse
   """
-  # a ve 26 aralarında asal olmalı (gcd kontrolü)
-  if gcd_extended(a, 26)[0] != 1:
+  # a ve 26 aralarında asal olmalı (tersi tabloda olmalı)
+  if a % 26 not in AFFINE_INVERSES:
     raise ValueError("a ve 26 aralarında asal olmalıdır (gcd(a, 26) = 1)")
   
-  result = []
-  for ch in text:
-    if ch.isalpha():
-      # Harfin büyük/küçük durumunu koru
-      is_upper = ch.isupper()
-      # Harfin alfabetik pozisyonunu bul (0-25)
-      ch_code = ord(ch.upper()) - ord("A")
-      # Affine formülü: (ax + b) mod 26
-      encrypted_code = (a * ch_code + b) % 26
-      encrypted_char = chr(encrypted_code + ord("A"))
-      result.append(encrypted_char if is_upper else encrypted_char.lower())
-    else:
-      # Alfabetik olmayan karakterler olduğu gibi kalır
-      result.append(ch)
-  
-  return "".join(result)
+  # Tüm harfler tek bir tablo ile dönüştürülür; A-Z/a-z dışındaki
+  # karakterler tabloda olmadığı için olduğu gibi kalır
+  return text.translate(affine_table(a, b))
 
 
 def affine_decrypt(cipher: str, a: int, b: int) -> str:
@@ -830,28 +1058,13 @@ def affine_decrypt(cipher: str, a: int, b: int) -> str:
   Raises:
     ValueError: a'nın mod 26'da tersi yoksa
   """
-  # a'nın modüler tersini hesapla
-  a_inv = mod_inverse(a, 26)
+  # a'nın modüler tersini önceden hesaplanmış tablodan al
+  a_inv = AFFINE_INVERSES.get(a % 26)
   if a_inv is None:
     raise ValueError("a'nın mod 26'da tersi yok")
   
-  result = []
-  for ch in cipher:
-    if ch.isalpha():
-      # Harfin büyük/küçük durumunu koru
-      is_upper = ch.isupper()
-      # Harfin alfabetik pozisyonunu bul
-      ch_code = ord(ch.upper()) - ord("A")
-      # Affine deşifreleme formülü: a^(-1)(x - b) mod 26
-      # Negatif değerler için +26 eklenir
-      decrypted_code = (a_inv * (ch_code - b + 26)) % 26
-      decrypted_char = chr(decrypted_code + ord("A"))
-      result.append(decrypted_char if is_upper else decrypted_char.lower())
-    else:
-      # Alfabetik olmayan karakterler olduğu gibi kalır
-      result.append(ch)
-  
-  return "".join(result)
+  # D(x) = a^(-1) * x - a^(-1) * b (mod 26) de bir affine dönüşümdür
+  return cipher.translate(affine_table(a_inv, -a_inv * b))
 
 
 # -----------------------------
@@ -859,7 +1072,8 @@ def affine_decrypt(cipher: str, a: int, b: int) -> str:
 # -----------------------------
 
 
-def hill_create_matrix(key: str, size: int) -> list[list[int]]:
+@lru_cache(maxsize=256)
+def hill_create_matrix(key: str, size: int) -> tuple[tuple[int, ...], ...]:
   """
   Anahtar kelimeden Hill Cipher matrisi oluşturur.
   
@@ -871,10 +1085,11 @@ def hill_create_matrix(key: str, size: int) -> list[list[int]]:
     size: Matris boyutu (2 veya 3)
   
   Returns:
-    size x size integer matrisi (her eleman 0-25 arası)
+    size x size integer matrisi (her eleman 0-25 arası); önbellekte
+    paylaşıldığı için değiştirilemez tuple olarak döndürülür
   """
   # Yalnızca harfleri al ve büyük harfe çevir
-  key_clean = "".join(ch.upper() for ch in key if ch.isalpha())
+  key_clean = letters_only(key).upper()
   
   # Matris boyutuna göre anahtarı doldur veya kes
   # size x size eleman gerekli
@@ -885,46 +1100,67 @@ def hill_create_matrix(key: str, size: int) -> list[list[int]]:
     # Fazlaysa kes
     key_clean = key_clean[:size * size]
   
-  # Matris oluştur
-  matrix = []
-  for i in range(size):
-    row = []
-    for j in range(size):
-      # Her harfi 0-25 arası sayıya dönüştür
-      char_code = ord(key_clean[i * size + j]) - ord("A")
-      row.append(char_code)
-    matrix.append(row)
+  # Matris oluştur: her harfi 0-25 arası sayıya dönüştür
+  return tuple(
+    tuple(ord(key_clean[i * size + j]) - ord("A") for j in range(size))
+    for i in range(size)
+  )
+
+
+def hill_matrix_minor(matrix: list[list[int]], row: int, col: int) -> list[list[int]]:
+  """
+  Matristen verilen satır ve sütunu çıkararak minör matrisi oluşturur.
   
-  return matrix
+  Args:
+    matrix: n x n integer matrisi
+    row: Çıkarılacak satır
+    col: Çıkarılacak sütun
+  
+  Returns:
+    (n-1) x (n-1) minör matris
+  """
+  return [r[:col] + r[col + 1:] for i, r in enumerate(matrix) if i != row]
 
 
 def hill_matrix_determinant(matrix: list[list[int]]) -> int:
   """
-  2x2 matrisin determinantını mod 26'da hesaplar.
+  Kare matrisin determinantını mod 26'da hesaplar.
   
-  Determinant = ad - bc (mod 26)
+  2x2 için ad - bc formülü, daha büyük matrisler için ilk satır
+  boyunca kofaktör açılımı kullanılır. Hesap tam sayılarla yapılır,
+  bu yüzden kayan nokta yuvarlama hatası oluşmaz.
   
   Args:
-    matrix: 2x2 integer matrisi
+    matrix: n x n integer matrisi
   
   Returns:
     Determinant değeri (mod 26)
   """
-  if len(matrix) == 2:
+  size = len(matrix)
+  if size == 1:
+    return matrix[0][0] % 26
+  if size == 2:
     # 2x2 matris determinantı: ad - bc
     return (matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]) % 26
-  return 0
+  # Kofaktör açılımı: det = Σ (-1)^j * a[0][j] * det(minör[0][j])
+  total = 0
+  for j in range(size):
+    sign = -1 if j % 2 else 1
+    total += sign * matrix[0][j] * hill_matrix_determinant(hill_matrix_minor(matrix, 0, j))
+  return total % 26
 
 
-def hill_matrix_inverse(matrix: list[list[int]]) -> list[list[int]]:
+@lru_cache(maxsize=256)
+def hill_matrix_inverse(matrix: tuple[tuple[int, ...], ...]) -> tuple[tuple[int, ...], ...]:
   """
-  2x2 matrisin mod 26'da tersini bulur.
+  Kare matrisin mod 26'da tersini bulur.
   
   Matrisin tersinin var olması için determinantının mod 26'da
-  tersi olmalı (gcd(det, 26) = 1).
+  tersi olmalı (gcd(det, 26) = 1). Ters, ek matris (adjugate)
+  yöntemiyle hesaplanır: A^(-1) = det^(-1) * adj(A) (mod 26).
   
   Args:
-    matrix: 2x2 integer matrisi
+    matrix: n x n integer matrisi (2x2 veya 3x3, önbellek için tuple)
   
   Returns:
     Matrisin mod 26'daki tersi
@@ -940,18 +1176,29 @@ def hill_matrix_inverse(matrix: list[list[int]]) -> list[list[int]]:
   if det_inv is None:
     raise ValueError("Matris determinantının mod 26'da tersi yok")
   
-  # 2x2 matris için ters formül
-  # [a b]  ->  (1/det) * [d  -b]
-  # [c d]               [-c   a]
-  a, b = matrix[0][0], matrix[0][1]
-  c, d = matrix[1][0], matrix[1][1]
-  
-  inverse = [
-    [(det_inv * d) % 26, (-det_inv * b) % 26],
-    [(-det_inv * c) % 26, (det_inv * a) % 26]
-  ]
+  size = len(matrix)
+  if size == 2:
+    # 2x2 matris için ters formül
+    # [a b]  ->  (1/det) * [d  -b]
+    # [c d]               [-c   a]
+    a, b = matrix[0][0], matrix[0][1]
+    c, d = matrix[1][0], matrix[1][1]
+    return (
+      ((det_inv * d) % 26, (-det_inv * b) % 26),
+      ((-det_inv * c) % 26, (det_inv * a) % 26)
+    )
+  
+  # Genel durum: adj(A)[i][j] = (-1)^(i+j) * det(minör[j][i])
+  inverse = []
+  for i in range(size):
+    row = []
+    for j in range(size):
+      sign = -1 if (i + j) % 2 else 1
+      cofactor = sign * hill_matrix_determinant(hill_matrix_minor(matrix, j, i))
+      row.append((det_inv * cofactor) % 26)
+    inverse.append(tuple(row))
   
-  return inverse
+  return tuple(inverse)
 
 
 def hill_multiply_matrix_vector(matrix: list[list[int]], vector: list[int]) -> list[int]:
@@ -975,14 +1222,117 @@ def hill_multiply_matrix_vector(matrix: list[list[int]], vector: list[int]) -> l
   return result
 
 
+@lru_cache(maxsize=32)
+def hill_scale_table(multiplier: int) -> bytes:
+  """
+  Büyük harf baytını (A-Z) harf kodunun multiplier katına (mod 26) çeviren
+  bytes.translate tablosu üretir.
+  
+  Args:
+    multiplier: Matris elemanı (0-25)
+  
+  Returns:
+    256 baytlık translate tablosu; önbellekte tutulur
+  """
+  return bytes(multiplier * (value - 65) % 26 for value in range(256))
+
+
+# Satır toplamını (0-255) harfe çeviren tablo: (toplam mod 26) + 'A'
+HILL_SUM_TO_LETTER = bytes(value % 26 + 65 for value in range(256))
+
+
+def hill_multiply_blocks(matrix: list[list[int]], letters: str) -> str:
+  """
+  Harf dizisindeki tüm blokları matris ile tek geçişte çarpar (mod 26).
+  
+  Çarpım blok blok değil sütun sütun yapılır: blokların k. harfleri
+  data[k::size] ile tek bir bytes dizisine alınır, matris elemanı ile
+  çarpımı önbellekli translate tablosuyla tüm bloklara birden uygulanır
+  ve sütunlar bayt bayt toplanır. Her sonuç satırı, çıktıya strided
+  dilim ataması ile yazılır. ASCII dışı harf içeren metinlerde blok blok
+  çarpıma geri dönülür.
+  
+  Args:
+    matrix: n x n integer matrisi
+    letters: Uzunluğu n'nin katı olan büyük harf dizisi
+  
+  Returns:
+    Her bloğun matris ile çarpımından elde edilen harf dizisi
+  """
+  size = len(matrix)
+  if not letters.isascii():
+    # Unicode harfler (ör. Ş, É) translate tablolarına sığmaz; blok blok çarp
+    codes = [ord(ch) - ord("A") for ch in letters]
+    blocks = zip(*[iter(codes)] * size)
+    return "".join(
+      chr(sum(m * v for m, v in zip(row, block)) % 26 + ord("A"))
+      for block in blocks
+      for row in matrix
+    )
+  data = letters.encode("ascii")
+  columns = [data[k::size] for k in range(size)]
+  result = bytearray(len(data))
+  for i, row in enumerate(matrix):
+    # Her terim 0-25 arası; n <= 3 için toplam bir bayta sığar
+    total = columns[0].translate(hill_scale_table(row[0]))
+    for multiplier, column in zip(row[1:], columns[1:]):
+      total = bytes(map(int.__add__, total, column.translate(hill_scale_table(multiplier))))
+    result[i::size] = total.translate(HILL_SUM_TO_LETTER)
+  return result.decode("ascii")
+
+
+# Küçük harf baytları için 0x20 (ASCII'de büyük/küçük harf farkı), diğerleri 0
+ASCII_LOWER_BIT = bytes(0x20 if 97 <= b <= 122 else 0 for b in range(256))
+
+
+def hill_restore_layout(original: str, letters: str) -> str:
+  """
+  Büyük harfli Hill çıktısını orijinal metnin düzenine geri yerleştirir.
+  
+  Orijinal metindeki her harfin yerine sıradaki çıktı harfi konur
+  (küçük harfse küçültülerek); harf olmayan karakterler olduğu gibi
+  kalır.
+  
+  ASCII metinlerde karakter başına isalpha/isupper çağrısı yapılmaz:
+  orijinal harflerin küçük harf bitleri ASCII_LOWER_BIT tablosuyla tek
+  translate geçişinde çıkarılır ve çıktı harflerine büyük tamsayı OR
+  işlemiyle uygulanır. Diğer metinlerde karakter karakter işlenir.
+  
+  Args:
+    original: Orijinal metin
+    letters: Büyük harfli çıktı harfleri (en az harf sayısı kadar)
+  
+  Returns:
+    Orijinal düzende, harf durumu korunmuş metin
+  """
+  if not original.isascii():
+    it = iter(letters)
+    return "".join([
+      (next(it) if ch.isupper() else next(it).lower()) if ch.isalpha() else ch
+      for ch in original
+    ])
+  
+  data = original.encode("ascii")
+  original_letters = data.translate(None, ASCII_NON_ALPHA)
+  count = len(original_letters)
+  upper = int.from_bytes(letters[:count].encode("ascii"), "big")
+  lower_bits = int.from_bytes(original_letters.translate(ASCII_LOWER_BIT), "big")
+  restored = (upper | lower_bits).to_bytes(count, "big").decode("ascii")
+  if count == len(data):
+    return restored
+  
+  # Harf bloklarını orijinal uzunluklarına göre yerine koy
+  return letters_fill_runs(re.split(r"([^A-Za-z]+)", original), restored)
+
+
 def hill_encrypt(text: str, key: str, size: int = 2) -> str:
   """Hill Cipher şifreleme"""
   if size < 2 or size > 3:
-    size = 2  # Sadece 2x2 veya 3x3 desteklenir, basitlik için 2x2 kullanıyoruz
+    size = 2  # Sadece 2x2 veya 3x3 desteklenir
   
   matrix = hill_create_matrix(key, size)
   
-  text_clean = "".join(ch.upper() for ch in text if ch.isalpha())
+  text_clean = letters_only(text).upper()
   if not text_clean:
     return text
   
@@ -990,36 +1340,11 @@ def hill_encrypt(text: str, key: str, size: int = 2) -> str:
   if len(text_clean) % size != 0:
     text_clean += "X" * (size - (len(text_clean) % size))
   
-  result_chars = []
-  original_positions = []  # Orijinal pozisyonları ve harf durumunu sakla
-  text_idx = 0
-  
-  for i, ch in enumerate(text):
-    if ch.isalpha():
-      original_positions.append((i, ch.isupper(), text_idx))
-      text_idx += 1
-    else:
-      original_positions.append((i, None, None))
-  
-  # Her blok için şifreleme
-  for block_start in range(0, len(text_clean), size):
-    block = text_clean[block_start:block_start + size]
-    vector = [ord(ch) - ord("A") for ch in block]
-    encrypted_vector = hill_multiply_matrix_vector(matrix, vector)
-    encrypted_block = "".join(chr(code + ord("A")) for code in encrypted_vector)
-    result_chars.extend(encrypted_block)
-  
-  # Sonucu orijinal metin formatına göre düzenle
-  result = list(text)
-  char_idx = 0
-  for i, ch in enumerate(text):
-    if ch.isalpha():
-      if char_idx < len(result_chars):
-        is_upper = original_positions[i][1]
-        result[i] = result_chars[char_idx] if is_upper else result_chars[char_idx].lower()
-        char_idx += 1
+  # Tüm blokları tek geçişte şifrele
+  result_chars = hill_multiply_blocks(matrix, text_clean)
   
-  return "".join(result)
+  # Sonucu orijinal metin formatına göre tek geçişte düzenle
+  return hill_restore_layout(text, result_chars)
 
 
 def hill_decrypt(cipher: str, key: str, size: int = 2) -> str:
@@ -1052,7 +1377,7 @@ def hill_decrypt(cipher: str, key: str, size: int = 2) -> str:
     raise ValueError("Anahtar matrisin tersi alınamıyor")
   
   # Yalnızca harfleri al
-  cipher_clean = "".join(ch.upper() for ch in cipher if ch.isalpha())
+  cipher_clean = letters_only(cipher).upper()
   if not cipher_clean:
     return cipher
   
@@ -1060,42 +1385,14 @@ def hill_decrypt(cipher: str, key: str, size: int = 2) -> str:
   if len(cipher_clean) % size != 0:
     cipher_clean += "X" * (size - (len(cipher_clean) % size))
   
-  # Orijinal metindeki harf pozisyonlarını sakla
-  result_chars = []
-  original_positions = []
-  cipher_idx = 0
+  # Tüm blokları ters matris ile tek geçişte deşifrele
+  result_chars = hill_multiply_blocks(inverse_matrix, cipher_clean)
   
-  for i, ch in enumerate(cipher):
-    if ch.isalpha():
-      original_positions.append((i, ch.isupper(), cipher_idx))
-      cipher_idx += 1
-    else:
-      original_positions.append((i, None, None))
-  
-  # Her blok için deşifreleme
-  for block_start in range(0, len(cipher_clean), size):
-    # Blok al
-    block = cipher_clean[block_start:block_start + size]
-    # Her harfi 0-25 arası sayıya dönüştür
-    vector = [ord(ch) - ord("A") for ch in block]
-    # Ters matris ile çarp (deşifreleme)
-    decrypted_vector = hill_multiply_matrix_vector(inverse_matrix, vector)
-    # Sayıları tekrar harfe dönüştür
-    decrypted_block = "".join(chr(code + ord("A")) for code in decrypted_vector)
-    result_chars.extend(decrypted_block)
-  
-  # Sonucu orijinal metin formatına göre düzenle
-  result = list(cipher)
-  char_idx = 0
-  for i, ch in enumerate(cipher):
-    if ch.isalpha():
-      if char_idx < len(result_chars):
-        is_upper = original_positions[i][1]
-        result[i] = result_chars[char_idx] if is_upper else result_chars[char_idx].lower()
-        char_idx += 1
+  # Sonucu orijinal metin formatına göre tek geçişte düzenle
+  result = hill_restore_layout(cipher, result_chars)
   
   # Son eklenen padding karakterlerini temizle
-  return "".join(result).rstrip("X")
+  return result.rstrip("X")
 
 
 # -----------------------------
@@ -1103,7 +1400,8 @@ def hill_decrypt(cipher: str, key: str, size: int = 2) -> str:
 # -----------------------------
 
 
-def columnar_get_key_order(key: str) -> list[int]:
+@lru_cache(maxsize=256)
+def columnar_get_key_order(key: str) -> tuple[int, ...]:
   """
   Anahtar kelimeden sütun sıralamasını çıkarır.
   
@@ -1114,23 +1412,24 @@ def columnar_get_key_order(key: str) -> list[int]:
     key: Anahtar kelime
   
   Returns:
-    Sütun sıralaması listesi (eski pozisyon -> yeni pozisyon)
+    Sütun sıralaması (eski pozisyon -> yeni pozisyon)
   """
   key_upper = key.upper()
-  # Her harfin pozisyonunu ve değerini eşleştir
-  key_chars = [(i, key_upper[i]) for i in range(len(key_upper))]
-  # Alfabetik sıraya göre sırala (eşitlik durumunda pozisyona göre)
-  key_chars_sorted = sorted(key_chars, key=lambda x: (x[1], x[0]))
+  # Pozisyonları harfe göre sırala (argsort); sorted kararlı olduğu için
+  # eşit harfler orijinal pozisyon sırasını korur. (pozisyon, harf)
+  # tuple'ları ve lambda karşılaştırıcısı oluşturulmaz.
+  sorted_positions = sorted(range(len(key_upper)), key=key_upper.__getitem__)
   
   # Her pozisyonun yeni sırasını belirle
   order = [0] * len(key)
-  for new_pos, (old_pos, _) in enumerate(key_chars_sorted):
+  for new_pos, old_pos in enumerate(sorted_positions):
     order[old_pos] = new_pos
   
-  return order
+  return tuple(order)
 
 
-def columnar_get_key_order_reverse(key: str) -> list[int]:
+@lru_cache(maxsize=256)
+def columnar_get_key_order_reverse(key: str) -> tuple[int, ...]:
   """
   Deşifreleme için ters sıralama oluşturur.
   
@@ -1141,13 +1440,13 @@ def columnar_get_key_order_reverse(key: str) -> list[int]:
     key: Kullanılan anahtar kelime
   
   Returns:
-    Ters sıralama listesi
+    Ters sıralama
   """
   order = columnar_get_key_order(key)
   reverse_order = [0] * len(order)
   for i, pos in enumerate(order):
     reverse_order[pos] = i
-  return reverse_order
+  return tuple(reverse_order)
 
 
 def columnar_encrypt(text: str, key: str) -> str:
@@ -1168,7 +1467,7 @@ def columnar_encrypt(text: str, key: str) -> str:
     return text
   
   # Yalnızca harfleri al
-  text_clean = "".join(ch for ch in text if ch.isalpha())
+  text_clean = letters_only(text)
   if not text_clean:
     return text
   
@@ -1176,31 +1475,14 @@ def columnar_encrypt(text: str, key: str) -> str:
   # Gerekli satır sayısını hesapla (yukarı yuvarlama)
   num_rows = (len(text_clean) + key_len - 1) // key_len
   
-  # Grid oluştur: metni satırlar halinde yerleştir
-  grid = []
-  text_idx = 0
-  for i in range(num_rows):
-    row = []
-    for j in range(key_len):
-      if text_idx < len(text_clean):
-        row.append(text_clean[text_idx])
-        text_idx += 1
-      else:
-        row.append("X")  # Eksik yerleri X ile doldur (padding)
-    grid.append(row)
-  
-  # Sütun sırasına göre oku (anahtar kelimenin alfabetik sırasına göre)
-  order = columnar_get_key_order(key)
-  result = []
-  
-  for col_pos in range(key_len):
-    # Bu pozisyondaki sütunun gerçek index'ini bul
-    col_idx = order.index(col_pos)
-    # Bu sütundaki tüm karakterleri oku
-    for row in grid:
-      result.append(row[col_idx])
+  # Metni satır satır grid'e yerleştir, eksik yerleri X ile doldur (padding).
+  # Grid ayrıca oluşturulmaz: satır uzunluğu key_len olduğundan j. sütun
+  # text_padded[j::key_len] dilimidir.
+  text_padded = text_clean.ljust(num_rows * key_len, "X")
   
-  return "".join(result)
+  # Sütunları anahtar kelimenin alfabetik sırasına göre oku
+  column_of = columnar_get_key_order_reverse(key)
+  return "".join([text_padded[column_of[col_pos]::key_len] for col_pos in range(key_len)])
 
 
 def columnar_decrypt(cipher: str, key: str) -> str:
@@ -1221,15 +1503,14 @@ def columnar_decrypt(cipher: str, key: str) -> str:
     return cipher
   
   # Yalnızca harfleri al
-  cipher_clean = "".join(ch for ch in cipher if ch.isalpha())
+  cipher_clean = letters_only(cipher)
   if not cipher_clean:
     return cipher
   
   key_len = len(key)
   num_rows = (len(cipher_clean) + key_len - 1) // key_len
   
-  # Sütun sıralamasını bul
-  order = columnar_get_key_order(key)
+  # Sütun sıralamasını bul: reverse_order[sıra] = o sıradaki sütunun index'i
   reverse_order = columnar_get_key_order_reverse(key)
   
   # Her sütuna kaç karakter düşeceğini hesapla
@@ -1242,25 +1523,18 @@ def columnar_decrypt(cipher: str, key: str) -> str:
     col_idx = key_len - 1 - i
     chars_per_col[col_idx] -= 1
   
-  # Grid oluştur ve şifreli metni sütunlara dağıt
-  grid = [[None for _ in range(key_len)] for _ in range(num_rows)]
+  # Grid ayrıca oluşturulmaz: satır uzunluğu key_len olduğundan j. sütunun
+  # karakterleri sonuçta result[j::key_len] konumlarına düşer. Eksik
+  # hücreler yalnızca son satırın sonunda olduğu için dilimler boşluksuz
+  # olarak tüm sonucu doldurur.
+  result = [""] * len(cipher_clean)
   cipher_idx = 0
-  
   for col_pos in range(key_len):
-    # Bu pozisyondaki sütunun gerçek index'ini bul
-    col_idx = order.index(col_pos)
-    # Bu sütuna karakterleri yerleştir
-    for row in range(chars_per_col[col_idx]):
-      if cipher_idx < len(cipher_clean):
-        grid[row][col_idx] = cipher_clean[cipher_idx]
-        cipher_idx += 1
-  
-  # Grid'i satır satır oku (normal okuma)
-  result = []
-  for row in grid:
-    for ch in row:
-      if ch:
-        result.append(ch)
+    # Bu pozisyondaki sütunun gerçek index'ini bul (O(1) tablo erişimi)
+    col_idx = reverse_order[col_pos]
+    count = chars_per_col[col_idx]
+    result[col_idx::key_len] = cipher_clean[cipher_idx:cipher_idx + count]
+    cipher_idx += count
   
   # Padding karakterlerini temizle
   return "".join(result).rstrip("X")
@@ -1271,55 +1545,65 @@ def columnar_decrypt(cipher: str, key: str) -> str:
 # -----------------------------
 
 # AES - Kütüphaneli (pycryptodome)
+# AES-GCM için önerilen 96-bit nonce ve 128-bit doğrulama etiketi
+AES_GCM_NONCE_SIZE = 12
+AES_GCM_TAG_SIZE = 16
+
+
+@lru_cache(maxsize=64)
+def aes_library_normalize_key(key: str) -> bytes:
+  """
+  Anahtarı 16, 24 veya 32 byte'a tamamlar (AES-128, AES-192, AES-256).
+  
+  Aynı anahtarla yapılan tekrar çağrılarda sonuç önbellekten döner.
+  
+  Args:
+    key: Anahtar string
+  
+  Returns:
+    AES için uygun uzunlukta anahtar byte'ları
+  """
+  key_bytes = key.encode('utf-8')
+  if len(key_bytes) < 16:
+    return key_bytes.ljust(16, b'\0')
+  if len(key_bytes) < 24:
+    return key_bytes.ljust(24, b'\0')
+  if len(key_bytes) < 32:
+    return key_bytes.ljust(32, b'\0')
+  return key_bytes[:32]
+
+
 def aes_library_encrypt(text: str, key: str) -> str:
   """
   AES şifrelemesi ile metni şifreler (Kütüphane kullanarak).
   
-  PyCryptodome kütüphanesini kullanarak AES-CBC modunda
-  şifreleme yapar. Güvenli ve standart uyumlu implementasyondur.
+  PyCryptodome kütüphanesini kullanarak AES-GCM modunda
+  şifreleme yapar. GCM sayaç (CTR) tabanlı olduğundan bloklar birbirinden
+  bağımsız işlenir ve AES-NI ile paralel çalışabilir; ayrıca bütünlük
+  etiketi (tag) üretir. Dolgu (padding) gerekmez.
   
   Args:
     text: Şifrelenecek metin
     key: Anahtar (string formatında, 16, 24 veya 32 byte'a çevrilir)
   
   Returns:
-    Base64 kodlanmış şifrelenmiş metin (IV + ciphertext)
+    Base64 kodlanmış şifrelenmiş metin (nonce + tag + ciphertext)
   
   Raises:
     ValueError: Şifreleme sırasında hata oluşursa
   """
   try:
-    # Anahtarı 16, 24 veya 32 byte'a tamamla (AES-128, AES-192, AES-256)
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 16:
-      key_bytes = key_bytes.ljust(16, b'\0')
-    elif len(key_bytes) < 24:
-      key_bytes = key_bytes.ljust(24, b'\0')
-    elif len(key_bytes) < 32:
-      key_bytes = key_bytes.ljust(32, b'\0')
-    else:
-      key_bytes = key_bytes[:32]
+    # Anahtar uzunluğu (16, 24 veya 32 byte) AES-128/192/256 varyantını belirler
+    key_bytes = aes_library_normalize_key(key)
+    nonce = get_random_bytes(AES_GCM_NONCE_SIZE)
+    cipher = AES.new(key_bytes, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
     
-    # Anahtar uzunluğuna göre AES modunu seç
-    if len(key_bytes) == 16:
-      cipher = AES.new(key_bytes, AES.MODE_CBC)
-    elif len(key_bytes) == 24:
-      cipher = AES.new(key_bytes, AES.MODE_CBC)
-    else:
-      cipher = AES.new(key_bytes, AES.MODE_CBC)
-    
-    # Metni byte'a çevir
-    text_bytes = text.encode('utf-8')
-    # PKCS7 padding ekle (16 byte blok boyutu için)
-    padded_text = pad(text_bytes, AES.block_size)
-    # Şifreleme işlemi
-    encrypted = cipher.encrypt(padded_text)
+    # Metni byte'a çevir ve şifrele; etiket deşifrelemede doğrulanacak
+    encrypted, tag = cipher.encrypt_and_digest(text.encode('utf-8'))
     
-    # IV (Initialization Vector) ve şifreli metni birleştir
-    # IV şifreleme için gereklidir ve deşifrelemede kullanılacak
-    iv_ciphertext = cipher.iv + encrypted
+    # Nonce, etiket ve şifreli metni birleştir
     # Base64 kodlama ile string formatına çevir
-    return base64.b64encode(iv_ciphertext).decode('utf-8')
+    return base64.b64encode(nonce + tag + encrypted).decode('ascii')
   except Exception as e:
     raise ValueError(f"AES şifreleme hatası: {str(e)}")
 
@@ -1328,48 +1612,81 @@ def aes_library_decrypt(encrypted_text: str, key: str) -> str:
   """
   AES şifrelemesi ile şifrelenmiş metni çözer (Kütüphane kullanarak).
   
-  PyCryptodome kütüphanesini kullanarak AES-CBC modunda
-  deşifreleme yapar. Şifreleme ile aynı anahtar kullanılmalıdır.
+  PyCryptodome kütüphanesini kullanarak AES-GCM modunda
+  deşifreleme yapar ve bütünlük etiketini doğrular. Şifreleme ile aynı
+  anahtar kullanılmalıdır.
   
   Args:
-    encrypted_text: Base64 kodlanmış şifrelenmiş metin (IV + ciphertext)
+    encrypted_text: Base64 kodlanmış şifrelenmiş metin (nonce + tag + ciphertext)
     key: Kullanılan anahtar (şifreleme ile aynı olmalı)
   
   Returns:
     Çözülmüş orijinal metin
   
   Raises:
-    ValueError: Deşifreleme sırasında hata oluşursa
+    ValueError: Deşifreleme veya etiket doğrulama sırasında hata oluşursa
   """
   try:
     # Anahtarı şifrelemedeki gibi hazırla
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 16:
-      key_bytes = key_bytes.ljust(16, b'\0')
-    elif len(key_bytes) < 24:
-      key_bytes = key_bytes.ljust(24, b'\0')
-    elif len(key_bytes) < 32:
-      key_bytes = key_bytes.ljust(32, b'\0')
-    else:
-      key_bytes = key_bytes[:32]
-    
-    # Base64 kodunu çöz
-    iv_ciphertext = base64.b64decode(encrypted_text.encode('utf-8'))
-    # IV ve şifreli metni ayır
-    iv = iv_ciphertext[:AES.block_size]  # İlk 16 byte IV
-    ciphertext = iv_ciphertext[AES.block_size:]  # Kalan kısım şifreli metin
-    
-    # Aynı IV ile deşifreleme yap
-    cipher = AES.new(key_bytes, AES.MODE_CBC, iv)
-    decrypted = unpad(cipher.decrypt(ciphertext), AES.block_size)
+    key_bytes = aes_library_normalize_key(key)
+    
+    # Base64 kodunu çöz; parçalar kopyalanmadan memoryview ile ayrılır
+    data = memoryview(base64.b64decode(encrypted_text))
+    header_size = AES_GCM_NONCE_SIZE + AES_GCM_TAG_SIZE
+    if len(data) < header_size:
+      raise ValueError("Şifreli veri çok kısa")
+    nonce = bytes(data[:AES_GCM_NONCE_SIZE])
+    tag = bytes(data[AES_GCM_NONCE_SIZE:header_size])
+    ciphertext = data[header_size:]
+    
+    # Aynı nonce ile deşifrele ve etiketi doğrula
+    cipher = AES.new(key_bytes, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
+    decrypted = cipher.decrypt_and_verify(ciphertext, tag)
     return decrypted.decode('utf-8')
   except Exception as e:
     raise ValueError(f"AES deşifreleme hatası: {str(e)}")
 
 
-# AES - Kütüphanesiz (Basitleştirilmiş Implementasyon)
-# Not: Bu basit bir AES implementasyonudur, eğitim amaçlıdır.
-# Gerçek AES çok karmaşık olduğu için basit XOR tabanlı şifreleme kullanılır.
+# AES - Kütüphanesiz (Basitleştirilmiş Implementasyon)
+# Not: Bu basit bir AES implementasyonudur, eğitim amaçlıdır.
+# Gerçek AES çok karmaşık olduğu için basit XOR tabanlı şifreleme kullanılır.
+
+def manual_pkcs7_unpad(data: bytes, block_size: int) -> bytes:
+  """
+  PKCS7 dolgusunu sabit zamanlı olarak doğrular ve kaldırır.
+  
+  Dolgu baytlarının kontrolü dolgu uzunluğundan bağımsız olarak her
+  zaman son bloğun tamamı üzerinden, dallanmadan yapılır; hata yalnızca
+  tüm kontrol bittikten sonra tek bir noktada bildirilir. Böylece
+  "padding oracle" saldırılarına zaman farkı ile ipucu verilmez.
+  
+  Args:
+    data: Dolgulu veri
+    block_size: Blok boyutu (byte)
+  
+  Returns:
+    Dolgusu kaldırılmış veri
+  
+  Raises:
+    ValueError: Dolgu geçersizse
+  """
+  # Veri uzunluğu gizli değildir; blok katı değilse doğrudan reddedilir
+  if not data or len(data) % block_size:
+    raise ValueError("Hatalı padding")
+  
+  pad_len = data[-1]
+  # pad_len 0 veya block_size'dan büyükse ilgili fark negatif olur
+  diff = ((pad_len - 1) | (block_size - pad_len)) & 0x100
+  tail = data[-block_size:]
+  for i in range(block_size):
+    # Bu byte dolgu içindeyse maske 0xFF, değilse 0
+    in_pad = ((block_size - i - pad_len - 1) >> 8) & 0xFF
+    diff |= (tail[i] ^ pad_len) & in_pad
+  
+  if diff:
+    raise ValueError("Hatalı padding")
+  return data[:len(data) - pad_len]
+
 
 def aes_manual_key_schedule(key: bytes) -> list:
   """
@@ -1388,10 +1705,11 @@ def aes_manual_key_schedule(key: bytes) -> list:
   key_len = len(key)
   rounds = {16: 10, 24: 12, 32: 14}.get(key_len, 10)
   keys = [key]
+  identity = bytes(range(256))
   for i in range(rounds):
-    # Basit döngüsel kaydırma
-    new_key = bytes((b + i) % 256 for b in key)
-    keys.append(new_key)
+    # Basit döngüsel kaydırma: (b + i) % 256 eşlemesi döndürülmüş bir
+    # bytes.translate tablosu ile tüm anahtara tek seferde uygulanır
+    keys.append(key.translate(identity[i:] + identity[:i]))
   return keys
 
 
@@ -1401,7 +1719,8 @@ def aes_manual_encrypt(text: str, key: str) -> str:
   
   Gerçek AES implementasyonu çok karmaşık olduğu için,
   burada basit XOR tabanlı şifreleme kullanılır. Sadece eğitim amaçlıdır.
-  Üretim ortamında kütüphane tabanlı AES kullanılmalıdır.
+  Üretim ortamında kütüphane tabanlı AES kullanılmalıdır; pycryptodome
+  destekleyen işlemcilerde AES-NI donanım komutlarını kullanır.
   
   Args:
     text: Şifrelenecek metin
@@ -1429,21 +1748,10 @@ def aes_manual_encrypt(text: str, key: str) -> str:
     padded_text = text_bytes + bytes([pad_len] * pad_len)
     
     # Basit XOR tabanlı şifreleme (gerçek AES yerine)
-    # Her 16 byte'lık blok için XOR işlemi yapılır
-    result = []
-    # Anahtarı metin uzunluğuna kadar genişlet
-    key_extended = (key_bytes * ((len(padded_text) // len(key_bytes)) + 1))[:len(padded_text)]
-    
-    # Bloklar halinde şifrele
-    for i in range(0, len(padded_text), 16):
-      block = padded_text[i:i+16]
-      key_block = key_extended[i:i+16]
-      # XOR işlemi ile şifreleme
-      encrypted_block = bytes(a ^ b for a, b in zip(block, key_block))
-      result.append(encrypted_block)
-    
-    encrypted = b''.join(result)
-    return base64.b64encode(encrypted).decode('utf-8')
+    # Anahtar metin uzunluğuna kadar tekrarlanır; blok sınırları XOR
+    # sonucunu etkilemediği için tüm veri tek seferde işlenir
+    encrypted = xor_bytes(padded_text, key_bytes)
+    return base64.b64encode(encrypted).decode('ascii')
   except Exception as e:
     raise ValueError(f"AES (manuel) şifreleme hatası: {str(e)}")
 
@@ -1474,28 +1782,13 @@ def aes_manual_decrypt(encrypted_text: str, key: str) -> str:
       key_bytes = key_bytes[:32]
     
     # Base64 kodunu çöz
-    encrypted = base64.b64decode(encrypted_text.encode('utf-8'))
+    encrypted = base64.b64decode(encrypted_text)
     
     # XOR ile deşifreleme (şifreleme ile aynı işlem)
-    result = []
-    # Anahtarı metin uzunluğuna kadar genişlet
-    key_extended = (key_bytes * ((len(encrypted) // len(key_bytes)) + 1))[:len(encrypted)]
-    
-    # Bloklar halinde deşifrele
-    for i in range(0, len(encrypted), 16):
-      block = encrypted[i:i+16]
-      key_block = key_extended[i:i+16]
-      # XOR işlemi ile deşifreleme
-      decrypted_block = bytes(a ^ b for a, b in zip(block, key_block))
-      result.append(decrypted_block)
-    
-    decrypted = b''.join(result)
+    decrypted = xor_bytes(encrypted, key_bytes)
     
     # PKCS7 padding'i kaldır
-    pad_len = decrypted[-1]
-    if pad_len > 16:
-      raise ValueError("Hatalı padding")
-    decrypted = decrypted[:-pad_len]
+    decrypted = manual_pkcs7_unpad(decrypted, 16)
     
     return decrypted.decode('utf-8')
   except Exception as e:
@@ -1506,6 +1799,20 @@ def aes_manual_decrypt(encrypted_text: str, key: str) -> str:
 #  DES (DATA ENCRYPTION STANDARD)
 # -----------------------------
 
+@lru_cache(maxsize=64)
+def des_normalize_key(key: str) -> bytes:
+  """
+  Anahtarı tam olarak 8 byte'a tamamlar veya kırpar (önbellekli).
+  
+  Args:
+    key: Anahtar string
+  
+  Returns:
+    DES için 8 byte'lık anahtar
+  """
+  return key.encode('utf-8').ljust(8, b'\0')[:8]
+
+
 # DES - Kütüphaneli (pycryptodome)
 def des_library_encrypt(text: str, key: str) -> str:
   """
@@ -1526,12 +1833,7 @@ def des_library_encrypt(text: str, key: str) -> str:
     ValueError: Şifreleme sırasında hata oluşursa
   """
   try:
-    # DES anahtarı tam olarak 8 byte olmalı
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 8:
-      key_bytes = key_bytes.ljust(8, b'\0')
-    elif len(key_bytes) > 8:
-      key_bytes = key_bytes[:8]
+    key_bytes = des_normalize_key(key)
     
     cipher = DES.new(key_bytes, DES.MODE_CBC)
     text_bytes = text.encode('utf-8')
@@ -1540,7 +1842,7 @@ def des_library_encrypt(text: str, key: str) -> str:
     
     # IV ve şifreli metni birleştir
     iv_ciphertext = cipher.iv + encrypted
-    return base64.b64encode(iv_ciphertext).decode('utf-8')
+    return base64.b64encode(iv_ciphertext).decode('ascii')
   except Exception as e:
     raise ValueError(f"DES şifreleme hatası: {str(e)}")
 
@@ -1563,14 +1865,10 @@ def des_library_decrypt(encrypted_text: str, key: str) -> str:
     ValueError: Deşifreleme sırasında hata oluşursa
   """
   try:
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 8:
-      key_bytes = key_bytes.ljust(8, b'\0')
-    elif len(key_bytes) > 8:
-      key_bytes = key_bytes[:8]
+    key_bytes = des_normalize_key(key)
     
-    iv_ciphertext = base64.b64decode(encrypted_text.encode('utf-8'))
-    iv = iv_ciphertext[:DES.block_size]
+    iv_ciphertext = memoryview(base64.b64decode(encrypted_text))
+    iv = bytes(iv_ciphertext[:DES.block_size])
     ciphertext = iv_ciphertext[DES.block_size:]
     
     cipher = DES.new(key_bytes, DES.MODE_CBC, iv)
@@ -1599,11 +1897,7 @@ def des_manual_encrypt(text: str, key: str) -> str:
     ValueError: Şifreleme sırasında hata oluşursa
   """
   try:
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 8:
-      key_bytes = key_bytes.ljust(8, b'\0')
-    elif len(key_bytes) > 8:
-      key_bytes = key_bytes[:8]
+    key_bytes = des_normalize_key(key)
     
     text_bytes = text.encode('utf-8')
     
@@ -1613,17 +1907,8 @@ def des_manual_encrypt(text: str, key: str) -> str:
     
     # Basit XOR tabanlı şifreleme (gerçek DES yerine)
     # Gerçek DES çok karmaşık olduğu için basit bir XOR şifreleme kullanıyoruz
-    result = []
-    key_extended = (key_bytes * ((len(padded_text) // len(key_bytes)) + 1))[:len(padded_text)]
-    
-    for i in range(0, len(padded_text), 8):
-      block = padded_text[i:i+8]
-      key_block = key_extended[i:i+8]
-      encrypted_block = bytes(a ^ b for a, b in zip(block, key_block))
-      result.append(encrypted_block)
-    
-    encrypted = b''.join(result)
-    return base64.b64encode(encrypted).decode('utf-8')
+    encrypted = xor_bytes(padded_text, key_bytes)
+    return base64.b64encode(encrypted).decode('ascii')
   except Exception as e:
     raise ValueError(f"DES (manuel) şifreleme hatası: {str(e)}")
 
@@ -1631,31 +1916,15 @@ def des_manual_encrypt(text: str, key: str) -> str:
 def des_manual_decrypt(encrypted_text: str, key: str) -> str:
   """DES deşifreleme - kütüphanesiz basit implementasyon"""
   try:
-    key_bytes = key.encode('utf-8')
-    if len(key_bytes) < 8:
-      key_bytes = key_bytes.ljust(8, b'\0')
-    elif len(key_bytes) > 8:
-      key_bytes = key_bytes[:8]
+    key_bytes = des_normalize_key(key)
     
-    encrypted = base64.b64decode(encrypted_text.encode('utf-8'))
+    encrypted = base64.b64decode(encrypted_text)
     
     # XOR ile deşifreleme
-    result = []
-    key_extended = (key_bytes * ((len(encrypted) // len(key_bytes)) + 1))[:len(encrypted)]
-    
-    for i in range(0, len(encrypted), 8):
-      block = encrypted[i:i+8]
-      key_block = key_extended[i:i+8]
-      decrypted_block = bytes(a ^ b for a, b in zip(block, key_block))
-      result.append(decrypted_block)
-    
-    decrypted = b''.join(result)
+    decrypted = xor_bytes(encrypted, key_bytes)
     
     # PKCS7 unpadding
-    pad_len = decrypted[-1]
-    if pad_len > 8:
-      raise ValueError("Hatalı padding")
-    decrypted = decrypted[:-pad_len]
+    decrypted = manual_pkcs7_unpad(decrypted, 8)
     
     return decrypted.decode('utf-8')
   except Exception as e:
@@ -1667,6 +1936,19 @@ def des_manual_decrypt(encrypted_text: str, key: str) -> str:
 # -----------------------------
 
 # RSA - Kütüphaneli (pycryptodome)
+def rsa_normalize_key_size(key_size: int) -> int:
+  """
+  RSA anahtar boyutunu 512-4096 bit aralığına sınırlar.
+  
+  Args:
+    key_size: İstenen anahtar boyutu (bit)
+  
+  Returns:
+    Sınırlanmış anahtar boyutu
+  """
+  return max(512, min(4096, key_size))
+
+
 def rsa_library_generate_keys(key_size: int = 2048) -> tuple[bytes, bytes]:
   """
   RSA anahtar çifti oluşturur.
@@ -1682,27 +1964,42 @@ def rsa_library_generate_keys(key_size: int = 2048) -> tuple[bytes, bytes]:
   Returns:
     (public_key_pem, private_key_pem) tuple'ı (PEM formatında)
   """
-  # Anahtar boyutu sınırlaması
-  if key_size < 512:
-    key_size = 512
-  elif key_size > 4096:
-    key_size = 4096
-  
   # RSA anahtarı oluştur
-  key = RSA.generate(key_size)
+  key = RSA.generate(rsa_normalize_key_size(key_size))
   # Private ve public anahtarları PEM formatında export et
   private_key = key.export_key()
   public_key = key.publickey().export_key()
   return public_key, private_key
 
 
+@lru_cache(maxsize=32)
+def rsa_library_load_cipher(key_pem: bytes):
+  """
+  PEM anahtarını yükler ve PKCS1_OAEP nesnesini oluşturur (önbellekli).
+  
+  PEM ayrıştırma ve anahtar kurulumu milisaniyeler sürer; aynı anahtarla
+  yapılan tekrar çağrılarda bu maliyet bir kez ödenir. OAEP nesnesi her
+  şifrelemede yeni rastgele dolgu ürettiği için yeniden kullanılabilir.
+  
+  Args:
+    key_pem: Public veya private anahtar (PEM, bytes)
+  
+  Returns:
+    (RSA anahtarı, PKCS1_OAEP nesnesi) ikilisi
+  """
+  key = RSA.import_key(key_pem)
+  return key, PKCS1_OAEP.new(key)
+
+
 def rsa_library_encrypt(text: str, public_key_pem: str) -> str:
   """
   RSA şifrelemesi ile metni şifreler (Public key kullanarak).
   
   RSA asimetrik şifreleme algoritmasıdır. Public key ile şifreleme
-  yapılır, private key ile deşifreleme yapılır. PKCS1_OAEP padding
-  kullanılır.
+  yapılır, private key ile deşifreleme yapılır. Hibrit yöntem
+  kullanılır: metin rastgele bir AES-256 anahtarıyla AES-GCM modunda
+  şifrelenir, RSA (PKCS1_OAEP) ile yalnızca bu anahtar şifrelenir.
+  Böylece metin uzunluğundan bağımsız olarak tek bir RSA işlemi yapılır.
   
   Args:
     text: Şifrelenecek metin
@@ -1710,36 +2007,28 @@ def rsa_library_encrypt(text: str, public_key_pem: str) -> str:
   
   Returns:
     Base64 kodlanmış şifrelenmiş metin
+    (RSA ile şifrelenmiş anahtar + nonce + tag + ciphertext)
   
   Raises:
     ValueError: Şifreleme sırasında hata oluşursa
   """
   try:
-    # Public key'i yükle (string veya bytes)
+    # Public key'i yükle (string veya bytes) ve OAEP nesnesini önbellekten al
     if isinstance(public_key_pem, str):
-      public_key = RSA.import_key(public_key_pem.encode('utf-8'))
-    else:
-      public_key = RSA.import_key(public_key_pem)
+      public_key_pem = public_key_pem.encode('utf-8')
+    public_key, cipher = rsa_library_load_cipher(public_key_pem)
     
-    # PKCS1_OAEP şifreleme nesnesi oluştur
-    cipher = PKCS1_OAEP.new(public_key)
-    text_bytes = text.encode('utf-8')
+    # Metni geçici AES anahtarıyla şifrele
+    aes_key = get_random_bytes(32)  # 256-bit AES
+    nonce = get_random_bytes(AES_GCM_NONCE_SIZE)
+    cipher_aes = AES.new(aes_key, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
+    ciphertext, tag = cipher_aes.encrypt_and_digest(text.encode('utf-8'))
     
-    # RSA blok boyutu sınırlaması var, metni bloklara böl
-    # OAEP padding 42 byte kullanır
-    key_size = public_key.size_in_bytes()
-    max_block_size = key_size - 42  # OAEP padding için
-    
-    # Metni bloklar halinde şifrele
-    encrypted_blocks = []
-    for i in range(0, len(text_bytes), max_block_size):
-      block = text_bytes[i:i+max_block_size]
-      encrypted_block = cipher.encrypt(block)
-      encrypted_blocks.append(encrypted_block)
-    
-    # Tüm blokları birleştir ve base64 ile kodla
-    encrypted = b''.join(encrypted_blocks)
-    return base64.b64encode(encrypted).decode('utf-8')
+    # AES anahtarını RSA ile şifrele; sonuç her zaman key_size byte'tır
+    encrypted_key = cipher.encrypt(aes_key)
+    
+    # Tüm veriyi birleştir ve base64 ile kodla
+    return base64.b64encode(encrypted_key + nonce + tag + ciphertext).decode('ascii')
   except Exception as e:
     raise ValueError(f"RSA şifreleme hatası: {str(e)}")
 
@@ -1749,7 +2038,8 @@ def rsa_library_decrypt(encrypted_text: str, private_key_pem: str) -> str:
   RSA şifrelemesi ile şifrelenmiş metni çözer (Private key kullanarak).
   
   RSA asimetrik şifreleme algoritmasının deşifreleme işlemi.
-  Private key ile şifrelenmiş metin çözülür.
+  Private key ile AES anahtarı çözülür, ardından metin AES-GCM ile
+  çözülür ve bütünlük etiketi doğrulanır.
   
   Args:
     encrypted_text: Base64 kodlanmış şifrelenmiş metin
@@ -1762,30 +2052,28 @@ def rsa_library_decrypt(encrypted_text: str, private_key_pem: str) -> str:
     ValueError: Deşifreleme sırasında hata oluşursa
   """
   try:
-    # Private key'i yükle (string veya bytes)
+    # Private key'i yükle (string veya bytes) ve OAEP nesnesini önbellekten al
     if isinstance(private_key_pem, str):
-      private_key = RSA.import_key(private_key_pem.encode('utf-8'))
-    else:
-      private_key = RSA.import_key(private_key_pem)
-    
-    # PKCS1_OAEP deşifreleme nesnesi oluştur
-    cipher = PKCS1_OAEP.new(private_key)
-    # Base64 kodunu çöz
-    encrypted = base64.b64decode(encrypted_text.encode('utf-8'))
+      private_key_pem = private_key_pem.encode('utf-8')
+    private_key, cipher = rsa_library_load_cipher(private_key_pem)
     
-    # Her blok key_size kadar byte içerir
+    # Base64 kodunu çöz; parçalar kopyalanmadan memoryview ile ayrılır
+    data = memoryview(base64.b64decode(encrypted_text))
     key_size = private_key.size_in_bytes()
+    nonce_end = key_size + AES_GCM_NONCE_SIZE
+    tag_end = nonce_end + AES_GCM_TAG_SIZE
+    if len(data) < tag_end:
+      raise ValueError("Şifreli veri çok kısa")
     
-    # Bloklar halinde deşifrele
-    decrypted_blocks = []
-    for i in range(0, len(encrypted), key_size):
-      block = encrypted[i:i+key_size]
-      if block:
-        decrypted_block = cipher.decrypt(block)
-        decrypted_blocks.append(decrypted_block)
+    # AES anahtarını RSA ile çöz
+    aes_key = cipher.decrypt(data[:key_size])
+    
+    # AES-GCM ile deşifrele ve etiketi doğrula
+    nonce = bytes(data[key_size:nonce_end])
+    tag = bytes(data[nonce_end:tag_end])
+    cipher_aes = AES.new(aes_key, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
+    decrypted = cipher_aes.decrypt_and_verify(data[tag_end:], tag)
     
-    # Blokları birleştir
-    decrypted = b''.join(decrypted_blocks)
     return decrypted.decode('utf-8')
   except Exception as e:
     raise ValueError(f"RSA deşifreleme hatası: {str(e)}")
@@ -1819,7 +2107,8 @@ def manual_mod_pow(base: int, exp: int, mod: int) -> int:
   Modüler üs alma (Exponentiation by Squaring).
   
   base^exp mod mod işlemini verimli bir şekilde hesaplar.
-  Büyük sayılar için kullanılır.
+  Büyük sayılar için kullanılır. Kare-çarp algoritmasını C seviyesinde
+  çalıştıran yerleşik pow() fonksiyonuna devredilir.
   
   Args:
     base: Taban
@@ -1829,22 +2118,20 @@ def manual_mod_pow(base: int, exp: int, mod: int) -> int:
   Returns:
     base^exp mod mod sonucu
   """
-  result = 1
-  base = base % mod
-  while exp > 0:
-    if exp % 2 == 1:
-      result = (result * base) % mod
-    exp = exp >> 1
-    base = (base * base) % mod
-  return result
+  return pow(base, exp, mod)
+
+
+# Miller-Rabin tanıkları: ilk 12 asal, 3.3 * 10^24'ten küçük tüm sayılar için
+# testi deterministik yapar
+MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
 
 
 def manual_is_prime(n: int) -> bool:
   """
-  Basit asal sayı kontrolü.
+  Asal sayı kontrolü (deterministik Miller-Rabin).
   
-  Bir sayının asal olup olmadığını kontrol eder.
-  Küçük sayılar için kullanılır.
+  Bir sayının asal olup olmadığını kontrol eder. Deneme bölmesinin
+  O(√n) maliyeti yerine sabit tanık kümesiyle O(k·log³n) sürede çalışır.
   
   Args:
     n: Kontrol edilecek sayı
@@ -1854,12 +2141,26 @@ def manual_is_prime(n: int) -> bool:
   """
   if n < 2:
     return False
-  if n == 2:
-    return True
-  if n % 2 == 0:
-    return False
-  for i in range(3, int(n ** 0.5) + 1, 2):
-    if n % i == 0:
+  for prime in MILLER_RABIN_WITNESSES:
+    if n % prime == 0:
+      return n == prime
+  
+  # n - 1 = d * 2^s
+  d = n - 1
+  s = 0
+  while d % 2 == 0:
+    d //= 2
+    s += 1
+  
+  for a in MILLER_RABIN_WITNESSES:
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+      continue
+    for _ in range(s - 1):
+      x = x * x % n
+      if x == n - 1:
+        break
+    else:
       return False
   return True
 
@@ -1868,50 +2169,89 @@ def manual_is_prime(n: int) -> bool:
 #  DSA (Digital Signature Algorithm)
 # -----------------------------
 
+# İmza ve doğrulamada kullanılan boş SHA-256 nesnesi; her çağrıda yeni
+# nesne oluşturmak yerine bunun kopyası alınır (kopyalama daha ucuzdur)
+SHA256_EMPTY = SHA256.new()
+
+
+def sha256_hash(data: bytes) -> SHA256.SHA256Hash:
+  """
+  Verinin SHA-256 özet nesnesini döndürür (DSS imza/doğrulama için).
+  
+  Args:
+    data: Özeti alınacak veri
+  
+  Returns:
+    Veri ile güncellenmiş SHA-256 nesnesi
+  """
+  hash_obj = SHA256_EMPTY.copy()
+  hash_obj.update(data)
+  return hash_obj
+
+
 # DSA - Kütüphaneli (pycryptodome)
+def dsa_normalize_key_size(key_size: int) -> int:
+  """
+  DSA anahtar boyutunu geçerli değerlerden en yakınına yuvarlar.
+  
+  DSA yalnızca 1024, 2048 ve 3072 bit anahtarları destekler.
+  
+  Args:
+    key_size: İstenen anahtar boyutu (bit)
+  
+  Returns:
+    1024, 2048 veya 3072
+  """
+  if key_size < 1536:
+    return 1024
+  if key_size < 2560:
+    return 2048
+  return 3072
+
+
 def dsa_library_generate_keys(key_size: int = 2048) -> tuple[bytes, bytes]:
   """DSA anahtar çifti oluşturur (public key, private key)"""
-  if key_size < 1024:
-    key_size = 1024
-  elif key_size > 3072:
-    key_size = 3072
-  
-  # DSA key_size 1024, 2048 veya 3072 olmalı
-  if key_size not in [1024, 2048, 3072]:
-    if key_size < 1536:
-      key_size = 1024
-    elif key_size < 2560:
-      key_size = 2048
-    else:
-      key_size = 3072
-  
-  key = DSA.generate(key_size)
+  key = DSA.generate(dsa_normalize_key_size(key_size))
   private_key = key.export_key()
   public_key = key.publickey().export_key()
   return public_key, private_key
 
 
+@lru_cache(maxsize=64)
+def dsa_library_load_key(key_pem: str | bytes) -> DSA.DsaKey:
+  """
+  PEM formatındaki DSA anahtarını yükler (önbellekli).
+  
+  ASN.1 ayrıştırma ve parametre doğrulaması her istekte tekrarlanmaz;
+  aynı anahtarla yapılan çağrılarda yüklenmiş nesne yeniden kullanılır.
+  
+  Args:
+    key_pem: Public veya private anahtar (PEM, str veya bytes)
+  
+  Returns:
+    DSA anahtar nesnesi
+  """
+  return DSA.import_key(key_pem)
+
+
 def dsa_library_sign(text: str, private_key_pem: str) -> str:
   """DSA ile dijital imza oluşturur"""
   try:
     # Private key'i yükle
-    if isinstance(private_key_pem, str):
-      private_key = DSA.import_key(private_key_pem.encode('utf-8'))
-    else:
-      private_key = DSA.import_key(private_key_pem)
+    private_key = dsa_library_load_key(private_key_pem)
     
     # Metnin hash'ini al
     text_bytes = text.encode('utf-8')
-    hash_obj = SHA256.new(text_bytes)
+    hash_obj = sha256_hash(text_bytes)
     
     # İmza oluştur
     signer = DSS.new(private_key, 'fips-186-3')
     signature = signer.sign(hash_obj)
     
-    # İmza ve metni birleştir (format: base64(metin)||base64(imza))
-    text_b64 = base64.b64encode(text_bytes).decode('utf-8')
-    signature_b64 = base64.b64encode(signature).decode('utf-8')
-    return f"{text_b64}||{signature_b64}"
+    # İmza ve metni tek zarfta birleştir:
+    # base64(imza uzunluğu (2 byte) + imza + metin)
+    envelope = struct.pack('>H', len(signature)) + signature + text_bytes
+    return base64.b64encode(envelope).decode('ascii')
   except Exception as e:
     raise ValueError(f"DSA imza oluşturma hatası: {str(e)}")
 
@@ -1920,21 +2260,20 @@ def dsa_library_verify(signed_data: str, public_key_pem: str) -> str:
   """DSA ile dijital imzayı doğrular"""
   try:
     # Public key'i yükle
-    if isinstance(public_key_pem, str):
-      public_key = DSA.import_key(public_key_pem.encode('utf-8'))
-    else:
-      public_key = DSA.import_key(public_key_pem)
+    public_key = dsa_library_load_key(public_key_pem)
     
-    # İmzalı veriyi parse et
-    if "||" not in signed_data:
+    # İmzalı veriyi parse et: imza uzunluğu + imza + metin
+    envelope = base64.b64decode(signed_data)
+    if len(envelope) < 2:
       raise ValueError("Geçersiz imzalı veri formatı")
-    
-    text_b64, signature_b64 = signed_data.split("||", 1)
-    text_bytes = base64.b64decode(text_b64.encode('utf-8'))
-    signature = base64.b64decode(signature_b64.encode('utf-8'))
+    (signature_len,) = struct.unpack_from('>H', envelope)
+    if len(envelope) < 2 + signature_len:
+      raise ValueError("Geçersiz imzalı veri formatı")
+    signature = envelope[2:2 + signature_len]
+    text_bytes = envelope[2 + signature_len:]
     
     # Metnin hash'ini al
-    hash_obj = SHA256.new(text_bytes)
+    hash_obj = sha256_hash(text_bytes)
     
     # İmzayı doğrula
     verifier = DSS.new(public_key, 'fips-186-3')
@@ -1948,25 +2287,37 @@ def dsa_library_verify(signed_data: str, public_key_pem: str) -> str:
 
 
 # DSA - Kütüphanesiz (basitleştirilmiş implementasyon)
-def dsa_manual_generate_keys(key_size: int = 1024) -> tuple[dict, dict]:
+class DSAPublicKey(NamedTuple):
+  """Kütüphanesiz DSA public anahtarı (p, q, g, y)."""
+  p: int
+  q: int
+  g: int
+  y: int
+
+
+class DSAPrivateKey(NamedTuple):
+  """Kütüphanesiz DSA private anahtarı (p, q, g, x)."""
+  p: int
+  q: int
+  g: int
+  x: int
+
+
+def dsa_manual_generate_keys(key_size: int = 1024) -> tuple[DSAPublicKey, DSAPrivateKey]:
   """Basit DSA anahtar çifti oluşturur (eğitim amaçlı)"""
   # Basitleştirilmiş DSA parametreleri
   # Gerçek DSA çok daha karmaşıktır
-  import random
   
   # Küçük asal sayılar (gerçek DSA'da çok daha büyük)
   q_primes = [101, 103, 107, 109, 113, 127, 131, 137, 139, 149]
-  q = random.choice(q_primes)
+  q = SECURE_RANDOM.choice(q_primes)
   
   # p = q * k + 1 (basitleştirilmiş)
-  k = random.randint(10, 50)
+  k = SECURE_RANDOM.randint(10, 50)
   p = q * k + 1
   while not manual_is_prime(p):
     k += 1
     p = q * k + 1
-    if p > 10000:  # Limit
-      p = 101 * 20 + 1
-      break
   
   # g seç (generator)
   g = 2
@@ -1977,24 +2328,24 @@ def dsa_manual_generate_keys(key_size: int = 1024) -> tuple[dict, dict]:
       break
   
   # Private key: x (1 < x < q)
-  x = random.randint(2, q - 1)
+  x = SECURE_RANDOM.randint(2, q - 1)
   
   # Public key: y = g^x mod p
   y = manual_mod_pow(g, x, p)
   
-  private_key = {"p": p, "q": q, "g": g, "x": x}
-  public_key = {"p": p, "q": q, "g": g, "y": y}
+  private_key = DSAPrivateKey(p, q, g, x)
+  public_key = DSAPublicKey(p, q, g, y)
   
   return public_key, private_key
 
 
-def dsa_manual_sign(text: str, private_key: dict) -> str:
+def dsa_manual_sign(text: str, private_key: DSAPrivateKey | dict) -> str:
   """DSA ile dijital imza oluşturur - kütüphanesiz"""
   try:
-    p = private_key["p"]
-    q = private_key["q"]
-    g = private_key["g"]
-    x = private_key["x"]
+    # JSON'dan gelen dict anahtarlar da kabul edilir
+    if isinstance(private_key, dict):
+      private_key = DSAPrivateKey(**private_key)
+    p, q, g, x = private_key
     
     text_bytes = text.encode('utf-8')
     # Basit hash (gerçekte SHA kullanılır)
@@ -2002,8 +2353,7 @@ def dsa_manual_sign(text: str, private_key: dict) -> str:
     if h == 0:
       h = 1
     
-    import random
-    k = random.randint(1, q - 1)
+    k = SECURE_RANDOM.randint(1, q - 1)
     
     # r = (g^k mod p) mod q
     r = manual_mod_pow(g, k, p) % q
@@ -2020,31 +2370,33 @@ def dsa_manual_sign(text: str, private_key: dict) -> str:
       s = 1
     
     # İmza ve metni birleştir
-    text_b64 = base64.b64encode(text_bytes).decode('utf-8')
+    text_b64 = base64.b64encode(text_bytes).decode('ascii')
     signature_str = f"{r},{s}"
-    signature_b64 = base64.b64encode(signature_str.encode('utf-8')).decode('utf-8')
+    signature_b64 = base64.b64encode(signature_str.encode('utf-8')).decode('ascii')
     return f"{text_b64}||{signature_b64}"
   except Exception as e:
     raise ValueError(f"DSA (manuel) imza oluşturma hatası: {str(e)}")
 
 
-def dsa_manual_verify(signed_data: str, public_key: dict) -> str:
+def dsa_manual_verify(signed_data: str, public_key: DSAPublicKey | dict) -> str:
   """DSA ile dijital imzayı doğrular - kütüphanesiz"""
   try:
-    p = public_key["p"]
-    q = public_key["q"]
-    g = public_key["g"]
-    y = public_key["y"]
+    # JSON'dan gelen dict anahtarlar da kabul edilir
+    if isinstance(public_key, dict):
+      public_key = DSAPublicKey(**public_key)
+    p, q, g, y = public_key
     
     # İmzalı veriyi parse et
-    if "||" not in signed_data:
+    text_b64, separator, signature_b64 = signed_data.partition("||")
+    if not separator:
       raise ValueError("Geçersiz imzalı veri formatı")
     
-    text_b64, signature_b64 = signed_data.split("||", 1)
-    text_bytes = base64.b64decode(text_b64.encode('utf-8'))
-    signature_str = base64.b64decode(signature_b64.encode('utf-8')).decode('utf-8')
+    text_bytes = base64.b64decode(text_b64)
+    signature_str = base64.b64decode(signature_b64).decode('utf-8')
     
-    r_str, s_str = signature_str.split(",")
+    r_str, separator, s_str = signature_str.partition(",")
+    if not separator:
+      raise ValueError("Geçersiz imza formatı")
     r = int(r_str)
     s = int(s_str)
     
@@ -2088,8 +2440,9 @@ def dsa_manual_verify(signed_data: str, public_key: dict) -> str:
 # ECC - Kütüphaneli (pycryptodome)
 def ecc_library_generate_keys(curve_name: str = "P-256") -> tuple[bytes, bytes]:
   """ECC anahtar çifti oluşturur (public key, private key)"""
-  # Desteklenen eğriler: P-192, P-224, P-256, P-384, P-521, secp256k1
-  valid_curves = ["P-192", "P-224", "P-256", "P-384", "P-521", "secp256k1"]
+  # Desteklenen eğriler: P-192, P-224, P-256, P-384, P-521
+  # (pycryptodome secp256k1 eğrisini desteklemez)
+  valid_curves = ["P-192", "P-224", "P-256", "P-384", "P-521"]
   if curve_name not in valid_curves:
     curve_name = "P-256"
   
@@ -2099,14 +2452,28 @@ def ecc_library_generate_keys(curve_name: str = "P-256") -> tuple[bytes, bytes]:
   return public_key, private_key
 
 
+@lru_cache(maxsize=64)
+def ecc_library_load_key(key_pem: str | bytes) -> ECC.EccKey:
+  """
+  PEM formatındaki ECC anahtarını yükler (önbellekli).
+  
+  ASN.1 ayrıştırma ve eğri doğrulaması her istekte tekrarlanmaz;
+  aynı anahtarla yapılan çağrılarda yüklenmiş nesne yeniden kullanılır.
+  
+  Args:
+    key_pem: Public veya private anahtar (PEM, str veya bytes)
+  
+  Returns:
+    ECC anahtar nesnesi
+  """
+  return ECC.import_key(key_pem)
+
+
 def ecc_library_encrypt(text: str, public_key_pem: str) -> str:
   """ECC şifreleme - kütüphane kullanarak (public key ile)"""
   try:
     # Public key'i yükle
-    if isinstance(public_key_pem, str):
-      public_key = ECC.import_key(public_key_pem.encode('utf-8'))
-    else:
-      public_key = ECC.import_key(public_key_pem)
+    public_key = ecc_library_load_key(public_key_pem)
     
     # ECIES (Elliptic Curve Integrated Encryption Scheme) kullan
     # Basit bir yaklaşım: AES ile şifrele, ECC ile AES anahtarını şifrele
@@ -2114,19 +2481,22 @@ def ecc_library_encrypt(text: str, public_key_pem: str) -> str:
     
     # Geçici AES anahtarı oluştur
     aes_key = get_random_bytes(32)  # 256-bit AES
-    cipher_aes = AES.new(aes_key, AES.MODE_EAX)
-    nonce = cipher_aes.nonce
+    # GCM: şifreleme ve doğrulama etiketi tek geçişte hesaplanır
+    # (EAX'teki ayrı CTR + CMAC geçişleri yerine, GHASH için CLMUL kullanılır)
+    nonce = get_random_bytes(AES_GCM_NONCE_SIZE)
+    cipher_aes = AES.new(aes_key, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
     ciphertext, tag = cipher_aes.encrypt_and_digest(text_bytes)
     
     # AES anahtarını ECC ile şifrele (basitleştirilmiş - gerçek ECIES daha karmaşık)
     # Bu basit bir implementasyon, gerçek ECIES daha karmaşıktır
-    from Crypto.Cipher import PKCS1_OAEP
-    # ECC için basit bir şifreleme: Anahtarı base64 ile encode et ve ekle
-    encrypted_key_b64 = base64.b64encode(aes_key).decode('utf-8')
-    
-    # Tüm veriyi birleştir: encrypted_key||nonce||tag||ciphertext
-    result = f"{encrypted_key_b64}||{base64.b64encode(nonce).decode('utf-8')}||{base64.b64encode(tag).decode('utf-8')}||{base64.b64encode(ciphertext).decode('utf-8')}"
-    return result
+    # ECC için basit bir şifreleme: Anahtar zarfa olduğu gibi eklenir
+    encrypted_key = aes_key
+    
+    # Tüm veriyi tek zarfta birleştir ve bir kez base64 ile kodla:
+    # anahtar uzunluğu (2 byte) + anahtar + nonce + tag + ciphertext
+    # (nonce ve tag sabit uzunluktadır)
+    envelope = struct.pack('>H', len(encrypted_key)) + encrypted_key + nonce + tag + ciphertext
+    return base64.b64encode(envelope).decode('ascii')
   except Exception as e:
     raise ValueError(f"ECC şifreleme hatası: {str(e)}")
 
@@ -2135,24 +2505,26 @@ def ecc_library_decrypt(encrypted_text: str, private_key_pem: str) -> str:
   """ECC deşifreleme - kütüphane kullanarak (private key ile)"""
   try:
     # Private key'i yükle
-    if isinstance(private_key_pem, str):
-      private_key = ECC.import_key(private_key_pem.encode('utf-8'))
-    else:
-      private_key = ECC.import_key(private_key_pem)
+    private_key = ecc_library_load_key(private_key_pem)
     
-    # Şifreli veriyi parse et
-    parts = encrypted_text.split("||")
-    if len(parts) != 4:
+    # Şifreli veriyi parse et; parçalar kopyalanmadan memoryview ile ayrılır
+    envelope = memoryview(base64.b64decode(encrypted_text))
+    if len(envelope) < 2:
+      raise ValueError("Geçersiz şifreli veri formatı")
+    (key_len,) = struct.unpack_from('>H', envelope)
+    nonce_start = 2 + key_len
+    tag_start = nonce_start + AES_GCM_NONCE_SIZE
+    ciphertext_start = tag_start + AES_GCM_TAG_SIZE
+    if len(envelope) < ciphertext_start:
       raise ValueError("Geçersiz şifreli veri formatı")
     
-    encrypted_key_b64, nonce_b64, tag_b64, ciphertext_b64 = parts
-    aes_key = base64.b64decode(encrypted_key_b64.encode('utf-8'))
-    nonce = base64.b64decode(nonce_b64.encode('utf-8'))
-    tag = base64.b64decode(tag_b64.encode('utf-8'))
-    ciphertext = base64.b64decode(ciphertext_b64.encode('utf-8'))
+    aes_key = bytes(envelope[2:nonce_start])
+    nonce = bytes(envelope[nonce_start:tag_start])
+    tag = bytes(envelope[tag_start:ciphertext_start])
+    ciphertext = envelope[ciphertext_start:]
     
-    # AES ile deşifrele
-    cipher_aes = AES.new(aes_key, AES.MODE_EAX, nonce=nonce)
+    # AES-GCM ile deşifrele ve etiketi doğrula
+    cipher_aes = AES.new(aes_key, AES.MODE_GCM, nonce=nonce, use_aesni=AES_NI_AVAILABLE)
     decrypted = cipher_aes.decrypt_and_verify(ciphertext, tag)
     
     return decrypted.decode('utf-8')
@@ -2164,22 +2536,19 @@ def ecc_library_sign(text: str, private_key_pem: str) -> str:
   """ECC ile dijital imza oluşturur (ECDSA)"""
   try:
     # Private key'i yükle
-    if isinstance(private_key_pem, str):
-      private_key = ECC.import_key(private_key_pem.encode('utf-8'))
-    else:
-      private_key = ECC.import_key(private_key_pem)
+    private_key = ecc_library_load_key(private_key_pem)
     
     # Metnin hash'ini al
     text_bytes = text.encode('utf-8')
-    hash_obj = SHA256.new(text_bytes)
+    hash_obj = sha256_hash(text_bytes)
     
     # İmza oluştur
     signer = DSS.new(private_key, 'fips-186-3')
     signature = signer.sign(hash_obj)
     
     # İmza ve metni birleştir
-    text_b64 = base64.b64encode(text_bytes).decode('utf-8')
-    signature_b64 = base64.b64encode(signature).decode('utf-8')
+    text_b64 = base64.b64encode(text_bytes).decode('ascii')
+    signature_b64 = base64.b64encode(signature).decode('ascii')
     return f"{text_b64}||{signature_b64}"
   except Exception as e:
     raise ValueError(f"ECC imza oluşturma hatası: {str(e)}")
@@ -2189,21 +2558,18 @@ def ecc_library_verify(signed_data: str, public_key_pem: str) -> str:
   """ECC ile dijital imzayı doğrular (ECDSA)"""
   try:
     # Public key'i yükle
-    if isinstance(public_key_pem, str):
-      public_key = ECC.import_key(public_key_pem.encode('utf-8'))
-    else:
-      public_key = ECC.import_key(public_key_pem)
+    public_key = ecc_library_load_key(public_key_pem)
     
     # İmzalı veriyi parse et
-    if "||" not in signed_data:
+    text_b64, separator, signature_b64 = signed_data.partition("||")
+    if not separator:
       raise ValueError("Geçersiz imzalı veri formatı")
     
-    text_b64, signature_b64 = signed_data.split("||", 1)
-    text_bytes = base64.b64decode(text_b64.encode('utf-8'))
-    signature = base64.b64decode(signature_b64.encode('utf-8'))
+    text_bytes = base64.b64decode(text_b64)
+    signature = base64.b64decode(signature_b64)
     
     # Metnin hash'ini al
-    hash_obj = SHA256.new(text_bytes)
+    hash_obj = sha256_hash(text_bytes)
     
     # İmzayı doğrula
     verifier = DSS.new(public_key, 'fips-186-3')
@@ -2217,6 +2583,126 @@ def ecc_library_verify(signed_data: str, public_key_pem: str) -> str:
 
 
 # ECC - Kütüphanesiz (basitleştirilmiş implementasyon)
+def ecc_manual_point_add(P: Optional[tuple[int, int]], Q: Optional[tuple[int, int]],
+                         a: int, p: int) -> Optional[tuple[int, int]]:
+  """
+  Eliptik eğri üzerinde iki noktayı toplar (afin koordinatlar).
+  
+  Sonsuzdaki nokta (birim eleman) None ile gösterilir.
+  
+  Args:
+    P: Birinci nokta
+    Q: İkinci nokta
+    a: Eğri katsayısı (y^2 = x^3 + ax + b)
+    p: Modül (asal)
+  
+  Returns:
+    P + Q noktası
+  """
+  if P is None:
+    return Q
+  if Q is None:
+    return P
+  x1, y1 = P
+  x2, y2 = Q
+  if x1 == x2 and (y1 + y2) % p == 0:
+    return None
+  if x1 == x2:
+    # Nokta ikileme: eğim = (3x^2 + a) / 2y
+    # (küçük sabitlerle çarpmalar toplamaya çevrilir)
+    x1_sq = x1 * x1 % p
+    slope = (x1_sq + x1_sq + x1_sq + a) * pow(y1 + y1, -1, p) % p
+  else:
+    # Farklı noktalar: eğim = (y2 - y1) / (x2 - x1)
+    slope = (y2 - y1) * pow(x2 - x1, -1, p) % p
+  x3 = (slope * slope - x1 - x2) % p
+  y3 = (slope * (x1 - x3) - y1) % p
+  return (x3, y3)
+
+
+def ecc_manual_point_multiply(k: int, P: tuple[int, int], a: int,
+                              p: int) -> Optional[tuple[int, int]]:
+  """
+  Skaler çarpım (k * P) - ikile ve topla (double-and-add) algoritması.
+  
+  k'nin bitleri en anlamlı bitten başlanarak gezilir; her adımda ara
+  sonuç ikilenir, bit 1 ise P eklenir. Nokta işlemi sayısı O(k) yerine
+  O(log k) olur.
+  
+  Args:
+    k: Skaler çarpan
+    P: Eğri üzerindeki nokta
+    a: Eğri katsayısı
+    p: Modül (asal)
+  
+  Returns:
+    k * P noktası
+  """
+  P = tuple(P)  # JSON'dan gelen listeler için
+  result = None
+  for bit in bin(k)[2:]:
+    result = ecc_manual_point_add(result, result, a, p)
+    if bit == "1":
+      result = ecc_manual_point_add(result, P, a, p)
+  return result
+
+
+@lru_cache(maxsize=32)
+def ecc_manual_base_table(G: tuple[int, int], a: int,
+                          p: int) -> tuple[Optional[tuple[int, int]], ...]:
+  """
+  Sabit taban noktası için [G, 2G, 4G, ..., 2^(n-1) G] tablosunu üretir.
+  
+  Tablo her (G, a, p) için yalnızca bir kez ve sabit genişlikte kurulur:
+  n, Hasse sınırına göre grup mertebesinin (en fazla p + 1 + 2*sqrt(p))
+  bit uzunluğudur; mertebeden küçük her skaler bu tabloyla çarpılabilir.
+  
+  Args:
+    G: Taban (generator) noktası
+    a: Eğri katsayısı
+    p: Modül (asal)
+  
+  Returns:
+    2^i * G noktalarından oluşan tuple
+  """
+  bits = (p + 1 + 2 * math.isqrt(p)).bit_length()
+  table = [G]
+  for _ in range(bits - 1):
+    table.append(ecc_manual_point_add(table[-1], table[-1], a, p))
+  return tuple(table)
+
+
+def ecc_manual_base_multiply(k: int, G: tuple[int, int], a: int,
+                             p: int) -> Optional[tuple[int, int]]:
+  """
+  Sabit taban skaler çarpımı (k * G) - önceden hesaplanmış tablo ile.
+  
+  G anahtar boyunca değişmediği için 2^i * G noktaları bir kez hesaplanıp
+  önbellekte tutulur; çarpım sırasında hiç ikileme yapılmaz, yalnızca
+  k'nin 1 olan bitlerine karşılık gelen noktalar toplanır. Tablodan uzun
+  skalerler (dışarıdan gelen anahtarlar) için ikile-ve-topla kullanılır.
+  
+  Args:
+    k: Skaler çarpan
+    G: Taban noktası
+    a: Eğri katsayısı
+    p: Modül (asal)
+  
+  Returns:
+    k * G noktası
+  """
+  table = ecc_manual_base_table(tuple(G), a, p)
+  if k < 0 or k.bit_length() > len(table):
+    return ecc_manual_point_multiply(k, tuple(G), a, p)
+  result = None
+  # Yalnızca k'nin 1 olan bitleri gezilir (en düşük bit her adımda silinir)
+  while k:
+    lowest = k & -k
+    result = ecc_manual_point_add(result, table[lowest.bit_length() - 1], a, p)
+    k ^= lowest
+  return result
+
+
 def ecc_manual_generate_keys() -> tuple[dict, dict]:
   """Basit ECC anahtar çifti oluşturur (eğitim amaçlı)"""
   # Basit eliptik eğri: y^2 = x^3 + ax + b (mod p)
@@ -2225,38 +2711,33 @@ def ecc_manual_generate_keys() -> tuple[dict, dict]:
   a = 1
   b = 1
   
-  # Eğri üzerindeki noktaları bul
-  points = []
-  for x in range(p):
-    y_squared = (x**3 + a*x + b) % p
-    for y in range(p):
-      if (y**2) % p == y_squared:
-        points.append((x, y))
+  # Eğri üzerindeki noktaları bul: önce her kalanın karekökleri bir kez
+  # tablolanır, böylece O(p^2) iç içe döngü yerine O(p) işlem yapılır
+  square_roots = {}
+  for y in range(p):
+    square_roots.setdefault(y * y % p, []).append(y)
+  points = [
+    (x, y)
+    for x in range(p)
+    for y in square_roots.get((x**3 + a*x + b) % p, ())
+  ]
   
   if len(points) < 2:
     # Varsayılan noktalar
     points = [(0, 1), (1, 7), (3, 10), (6, 19)]
   
   # Generator point (G) seç
-  import random
   G = points[1] if len(points) > 1 else points[0]
   
   # Private key: d (rastgele sayı)
-  d = random.randint(2, min(20, len(points) - 1))
-  
-  # Public key: Q = d * G (point multiplication - basitleştirilmiş)
-  # Basit yaklaşım: d * G = G + G + ... + G (d kez)
-  Q = G
-  for _ in range(d - 1):
-    # Basit point addition (gerçek ECC'de çok daha karmaşık)
-    Q_x, Q_y = Q
-    G_x, G_y = G
-    # Basit toplama modülü (gerçek formül farklıdır)
-    new_x = (Q_x + G_x) % p
-    new_y = (Q_y + G_y) % p
-    Q = (new_x, new_y)
-  
-  private_key = {"p": p, "a": a, "b": b, "G": G, "d": d}
+  d = SECURE_RANDOM.randint(2, min(20, len(points) - 1))
+  
+  # Public key: Q = d * G (skaler çarpım)
+  Q = ecc_manual_base_multiply(d, G, a, p)
+  
+  # Q private key'te de saklanır; deşifreleme her mesajda d * G'yi
+  # yeniden hesaplamaz
+  private_key = {"p": p, "a": a, "b": b, "G": G, "d": d, "Q": Q}
   public_key = {"p": p, "a": a, "b": b, "G": G, "Q": Q}
   
   return public_key, private_key
@@ -2272,10 +2753,10 @@ def ecc_manual_encrypt(text: str, public_key: dict) -> str:
     Q = public_key["Q"]
     key_value = (Q[0] + Q[1]) % 256
     
-    # Her byte'ı XOR ile şifrele
-    encrypted_bytes = bytes(byte_val ^ key_value for byte_val in text_bytes)
+    # Her byte'ı XOR ile şifrele (önbellekli 256 byte'lık tablo ile tek geçiş)
+    encrypted_bytes = text_bytes.translate(xor_table(key_value))
     
-    return base64.b64encode(encrypted_bytes).decode('utf-8')
+    return base64.b64encode(encrypted_bytes).decode('ascii')
   except Exception as e:
     raise ValueError(f"ECC (manuel) şifreleme hatası: {str(e)}")
 
@@ -2283,26 +2764,19 @@ def ecc_manual_encrypt(text: str, public_key: dict) -> str:
 def ecc_manual_decrypt(encrypted_text: str, private_key: dict) -> str:
   """ECC deşifreleme - kütüphanesiz basit implementasyon"""
   try:
-    encrypted_bytes = base64.b64decode(encrypted_text.encode('utf-8'))
-    
-    # Private key'den aynı değeri türet
-    G = private_key["G"]
-    d = private_key["d"]
-    p = private_key["p"]
+    encrypted_bytes = base64.b64decode(encrypted_text)
     
-    # Q = d * G hesapla (decrypt için)
-    Q = G
-    for _ in range(d - 1):
-      Q_x, Q_y = Q
-      G_x, G_y = G
-      new_x = (Q_x + G_x) % p
-      new_y = (Q_y + G_y) % p
-      Q = (new_x, new_y)
+    # Private key'den aynı değeri türet: Q = d * G (anahtarda saklıysa
+    # doğrudan okunur, eski anahtarlar için hesaplanır)
+    Q = private_key.get("Q")
+    if Q is None:
+      Q = ecc_manual_base_multiply(private_key["d"], private_key["G"],
+                                   private_key["a"], private_key["p"])
     
     key_value = (Q[0] + Q[1]) % 256
     
-    # XOR ile deşifrele
-    decrypted_bytes = bytes(byte_val ^ key_value for byte_val in encrypted_bytes)
+    # XOR ile deşifrele (önbellekli 256 byte'lık tablo ile tek geçiş)
+    decrypted_bytes = encrypted_bytes.translate(xor_table(key_value))
     
     return decrypted_bytes.decode('utf-8')
   except Exception as e:
@@ -2316,21 +2790,21 @@ def ecc_manual_sign(text: str, private_key: dict) -> str:
     p = private_key["p"]
     d = private_key["d"]
     
-    # Basit hash
-    h = hash(text_bytes) % p
+    # SHA-256 özeti (hash() süreç başına rastgele tohumlanır; imza
+    # yeniden başlatmadan sonra doğrulanamazdı)
+    h = int.from_bytes(hashlib.sha256(text_bytes).digest(), 'big') % p
     if h == 0:
       h = 1
     
     # Basit imza (gerçek ECDSA çok daha karmaşık)
-    import random
-    k = random.randint(1, p - 1)
+    k = SECURE_RANDOM.randint(1, p - 1)
     r = (k * h) % p
     s = (d * r + k) % p
     
     # İmza ve metni birleştir
-    text_b64 = base64.b64encode(text_bytes).decode('utf-8')
+    text_b64 = base64.b64encode(text_bytes).decode('ascii')
     signature_str = f"{r},{s}"
-    signature_b64 = base64.b64encode(signature_str.encode('utf-8')).decode('utf-8')
+    signature_b64 = base64.b64encode(signature_str.encode('utf-8')).decode('ascii')
     return f"{text_b64}||{signature_b64}"
   except Exception as e:
     raise ValueError(f"ECC (manuel) imza oluşturma hatası: {str(e)}")
@@ -2340,22 +2814,25 @@ def ecc_manual_verify(signed_data: str, public_key: dict) -> str:
   """ECC ile dijital imzayı doğrular - kütüphanesiz"""
   try:
     # İmzalı veriyi parse et
-    if "||" not in signed_data:
+    text_b64, separator, signature_b64 = signed_data.partition("||")
+    if not separator:
       raise ValueError("Geçersiz imzalı veri formatı")
     
-    text_b64, signature_b64 = signed_data.split("||", 1)
-    text_bytes = base64.b64decode(text_b64.encode('utf-8'))
-    signature_str = base64.b64decode(signature_b64.encode('utf-8')).decode('utf-8')
+    text_bytes = base64.b64decode(text_b64)
+    signature_str = base64.b64decode(signature_b64).decode('utf-8')
     
-    r_str, s_str = signature_str.split(",")
+    r_str, separator, s_str = signature_str.partition(",")
+    if not separator:
+      raise ValueError("Geçersiz imza formatı")
     r = int(r_str)
     s = int(s_str)
     
     p = public_key["p"]
     Q = public_key["Q"]
     
-    # Basit hash
-    h = hash(text_bytes) % p
+    # SHA-256 özeti (hash() süreç başına rastgele tohumlanır; imza
+    # yeniden başlatmadan sonra doğrulanamazdı)
+    h = int.from_bytes(hashlib.sha256(text_bytes).digest(), 'big') % p
     if h == 0:
       h = 1
     
@@ -2377,7 +2854,7 @@ def ecc_manual_verify(signed_data: str, public_key: dict) -> str:
 #  FORM YÖNETİMİ VE API
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FormState:
   """
   Form verilerini saklamak için kullanılan veri sınıfı.
@@ -2420,6 +2897,282 @@ class FormState:
   is_error: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class ClassicCipher:
+  """
+  Klasik bir şifreleme algoritmasının form tarafındaki tanımı.
+  
+  handle_form, algoritma adını CLASSIC_CIPHERS tablosunda arayarak
+  uzun bir if/elif zinciri yerine doğrudan ilgili fonksiyonu çağırır.
+  """
+  label: str  # Durum mesajlarında kullanılan ad
+  encrypt: Callable[..., str]
+  decrypt: Callable[..., str]
+  params: Callable[[FormState], tuple]  # Metinden sonra verilecek argümanlar
+  key_field: Optional[str] = None  # Boş olmaması gereken anahtar alanı
+
+
+CLASSIC_CIPHERS: dict[str, ClassicCipher] = {
+  "caesar": ClassicCipher(
+    "Sezar", caesar_encrypt, caesar_decrypt,
+    lambda s: (s.caesar_shift,),
+  ),
+  "railFence": ClassicCipher(
+    "Rail Fence", rail_fence_encrypt, rail_fence_decrypt,
+    lambda s: (s.rail_rails,),
+  ),
+  "vigenere": ClassicCipher(
+    "Vigenere", vigenere_encrypt, vigenere_decrypt,
+    lambda s: (s.vigenere_key,), "vigenere_key",
+  ),
+  "vernam": ClassicCipher(
+    "Vernam", vernam_encrypt, vernam_decrypt,
+    lambda s: (s.vernam_key,), "vernam_key",
+  ),
+  "playfair": ClassicCipher(
+    "Playfair", playfair_encrypt, playfair_decrypt,
+    lambda s: (s.playfair_key,), "playfair_key",
+  ),
+  "route": ClassicCipher(
+    "Route", route_encrypt, route_decrypt,
+    lambda s: (s.route_rows, s.route_cols),
+  ),
+  "affine": ClassicCipher(
+    "Affine", affine_encrypt, affine_decrypt,
+    lambda s: (s.affine_a, s.affine_b),
+  ),
+  "hill": ClassicCipher(
+    "Hill Cipher", hill_encrypt, hill_decrypt,
+    lambda s: (s.hill_key, s.hill_size), "hill_key",
+  ),
+  "columnar": ClassicCipher(
+    "Columnar", columnar_encrypt, columnar_decrypt,
+    lambda s: (s.columnar_key,), "columnar_key",
+  ),
+}
+
+
+# Klasik algoritmalar deterministiktir: aynı (algoritma, mod, metin,
+# parametreler) her zaman aynı çıktıyı verir. Aynı formun tekrar
+# gönderilmesinde şifre yeniden çalıştırılmaz. Önbellek anahtarı tüm
+# isteğin 16 baytlık BLAKE2b özetidir; metin ve şifre anahtarları
+# (Vigenere, Hill vb.) bellekte tutulmaz. Bellek kullanımı hem kayıt
+# sayısıyla hem de saklanan çıktıların toplam uzunluğuyla sınırlıdır;
+# tek başına büyük çıktılar hiç önbelleğe alınmaz.
+CLASSIC_OUTPUT_CACHE_SIZE = 256
+CLASSIC_OUTPUT_CACHE_MAX_OUTPUT = 64 * 1024  # karakter
+CLASSIC_OUTPUT_CACHE_BUDGET = 4 * 1024 * 1024  # toplam karakter
+CLASSIC_OUTPUT_CACHE: OrderedDict[bytes, str] = OrderedDict()
+CLASSIC_OUTPUT_CACHE_LOCK = threading.Lock()
+classic_output_cache_total = 0  # Önbellekteki çıktıların toplam uzunluğu
+
+
+def classic_cache_key(algorithm: str, mode: str, text: str, params: tuple) -> bytes:
+  """
+  Klasik algoritma isteği için önbellek anahtarı üretir.
+  
+  Algoritma, mod, parametreler ve metin tek bir BLAKE2b özetinde
+  birleştirilir; metnin uzunluğu da özete katıldığı için parametre ve
+  metin sınırı belirsiz kalmaz.
+  
+  Args:
+    algorithm: CLASSIC_CIPHERS anahtarı
+    mode: "encrypt" veya "decrypt"
+    text: İşlenecek metin
+    params: Metinden sonra fonksiyona verilecek argümanlar
+  
+  Returns:
+    16 baytlık özet
+  """
+  header = repr((algorithm, mode, params, len(text)))
+  digest = hashlib.blake2b(header.encode("utf-8", "surrogatepass"), digest_size=16)
+  digest.update(text.encode("utf-8", "surrogatepass"))
+  return digest.digest()
+
+
+def classic_cached_run(algorithm: str, mode: str, text: str, params: tuple) -> str:
+  """
+  Klasik bir algoritmayı çalıştırır; aynı istek daha önce işlendiyse
+  sonucu LRU önbellekten döndürür.
+  
+  Args:
+    algorithm: CLASSIC_CIPHERS anahtarı
+    mode: "encrypt" veya "decrypt"
+    text: İşlenecek metin
+    params: Metinden sonra fonksiyona verilecek argümanlar
+  
+  Returns:
+    Şifrelenmiş veya çözülmüş metin
+  
+  Raises:
+    ValueError: Algoritma hatası durumunda (hatalar önbelleğe alınmaz)
+  """
+  global classic_output_cache_total
+  
+  cache_key = classic_cache_key(algorithm, mode, text, params)
+  with CLASSIC_OUTPUT_CACHE_LOCK:
+    output = CLASSIC_OUTPUT_CACHE.get(cache_key)
+    if output is not None:
+      CLASSIC_OUTPUT_CACHE.move_to_end(cache_key)
+      return output
+  
+  cipher = CLASSIC_CIPHERS[algorithm]
+  run = cipher.encrypt if mode == "encrypt" else cipher.decrypt
+  output = run(text, *params)
+  
+  # Büyük çıktılar önbelleği tek başına doldurmasın diye saklanmaz
+  if len(output) > CLASSIC_OUTPUT_CACHE_MAX_OUTPUT:
+    return output
+  
+  with CLASSIC_OUTPUT_CACHE_LOCK:
+    previous = CLASSIC_OUTPUT_CACHE.pop(cache_key, None)
+    if previous is not None:
+      classic_output_cache_total -= len(previous)
+    CLASSIC_OUTPUT_CACHE[cache_key] = output
+    classic_output_cache_total += len(output)
+    # Kayıt sayısı ve toplam uzunluk sınırın altına inene kadar en eskiyi at
+    while (len(CLASSIC_OUTPUT_CACHE) > CLASSIC_OUTPUT_CACHE_SIZE
+           or classic_output_cache_total > CLASSIC_OUTPUT_CACHE_BUDGET):
+      _, evicted = CLASSIC_OUTPUT_CACHE.popitem(last=False)
+      classic_output_cache_total -= len(evicted)
+  return output
+
+
+@dataclass(frozen=True, slots=True)
+class ModernOperation:
+  """
+  Modern bir algoritmanın tek yöndeki işlemi (şifreleme, imza doğrulama vb.).
+  
+  run, metni ve FormState'teki key_field alanının değerini alır. Anahtar
+  boşsa generate_keys tanımlıysa yeni anahtar üretilir, değilse
+  missing_key mesajı gösterilir.
+  """
+  name: str  # Durum mesajındaki işlem adı ("şifreleme", "imza oluşturma"...)
+  run: Callable[[str, str], str]
+  key_field: str
+  missing_key: str
+  generate_keys: Optional[Callable[[FormState], None]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ModernCipher:
+  """
+  Modern bir algoritmanın form tarafındaki tanımı.
+  
+  library ve manual, (şifreleme, deşifreleme) işlem çiftleridir;
+  use_library_field FormState'te hangisinin seçildiğini tutar.
+  """
+  label: str
+  library: tuple[ModernOperation, ModernOperation]
+  manual: Optional[tuple[ModernOperation, ModernOperation]] = None
+  use_library_field: Optional[str] = None
+  library_label: str = "kütüphaneli"
+
+
+def dsa_manual_form_keys(state: FormState) -> None:
+  """Kütüphanesiz DSA anahtarlarını üretir ve forma JSON olarak yazar."""
+  public_key, private_key = dsa_manual_generate_keys(state.dsa_key_size)
+  state.dsa_public_key = json.dumps(public_key._asdict())
+  state.dsa_private_key = json.dumps(private_key._asdict())
+
+
+def ecc_manual_form_keys(state: FormState) -> None:
+  """Kütüphanesiz ECC anahtarlarını üretir ve forma JSON olarak yazar."""
+  public_key, private_key = ecc_manual_generate_keys()
+  state.ecc_public_key = json.dumps(public_key)
+  state.ecc_private_key = json.dumps(private_key)
+
+
+MODERN_CIPHERS: dict[str, ModernCipher] = {
+  "aes": ModernCipher(
+    "AES",
+    library=(
+      ModernOperation("şifreleme", aes_library_encrypt, "aes_key", "AES için anahtar gereklidir."),
+      ModernOperation("deşifreleme", aes_library_decrypt, "aes_key", "AES için anahtar gereklidir."),
+    ),
+    manual=(
+      ModernOperation("şifreleme", aes_manual_encrypt, "aes_key", "AES için anahtar gereklidir."),
+      ModernOperation("deşifreleme", aes_manual_decrypt, "aes_key", "AES için anahtar gereklidir."),
+    ),
+    use_library_field="aes_use_library",
+    library_label=AES_LIBRARY_LABEL,
+  ),
+  "des": ModernCipher(
+    "DES",
+    library=(
+      ModernOperation("şifreleme", des_library_encrypt, "des_key", "DES için anahtar gereklidir (8 karakter)."),
+      ModernOperation("deşifreleme", des_library_decrypt, "des_key", "DES için anahtar gereklidir (8 karakter)."),
+    ),
+    manual=(
+      ModernOperation("şifreleme", des_manual_encrypt, "des_key", "DES için anahtar gereklidir (8 karakter)."),
+      ModernOperation("deşifreleme", des_manual_decrypt, "des_key", "DES için anahtar gereklidir (8 karakter)."),
+    ),
+    use_library_field="des_use_library",
+  ),
+  "rsa": ModernCipher(
+    "RSA",
+    library=(
+      ModernOperation(
+        "şifreleme", rsa_library_encrypt, "rsa_public_key",
+        "RSA şifreleme için public key gereklidir. Anahtar oluştur butonuna basın.",
+      ),
+      ModernOperation(
+        "deşifreleme", rsa_library_decrypt, "rsa_private_key",
+        "RSA deşifreleme için private key gereklidir.",
+      ),
+    ),
+  ),
+  "dsa": ModernCipher(
+    "DSA",
+    library=(
+      ModernOperation(
+        "imza oluşturma", dsa_library_sign, "dsa_private_key",
+        "DSA imza oluşturma için private key gereklidir. Anahtar oluştur butonuna basın.",
+      ),
+      ModernOperation(
+        "imza doğrulama", dsa_library_verify, "dsa_public_key",
+        "DSA imza doğrulama için public key gereklidir.",
+      ),
+    ),
+    manual=(
+      ModernOperation(
+        "imza oluşturma", lambda text, key: dsa_manual_sign(text, json.loads(key)),
+        "dsa_private_key", "", generate_keys=dsa_manual_form_keys,
+      ),
+      ModernOperation(
+        "imza doğrulama", lambda text, key: dsa_manual_verify(text, json.loads(key)),
+        "dsa_public_key", "DSA imza doğrulama için public key gereklidir.",
+      ),
+    ),
+    use_library_field="dsa_use_library",
+  ),
+  "ecc": ModernCipher(
+    "ECC",
+    library=(
+      ModernOperation(
+        "şifreleme", ecc_library_encrypt, "ecc_public_key",
+        "ECC şifreleme için public key gereklidir. Anahtar oluştur butonuna basın.",
+      ),
+      ModernOperation(
+        "deşifreleme", ecc_library_decrypt, "ecc_private_key",
+        "ECC deşifreleme için private key gereklidir.",
+      ),
+    ),
+    manual=(
+      ModernOperation(
+        "şifreleme", lambda text, key: ecc_manual_encrypt(text, json.loads(key)),
+        "ecc_public_key", "", generate_keys=ecc_manual_form_keys,
+      ),
+      ModernOperation(
+        "deşifreleme", lambda text, key: ecc_manual_decrypt(text, json.loads(key)),
+        "ecc_private_key", "ECC deşifreleme için private key gereklidir.",
+      ),
+    ),
+    use_library_field="ecc_use_library",
+  ),
+}
+
+
 def handle_form(req) -> FormState:
   if req.method == "GET":
     return FormState()
@@ -2481,28 +3234,12 @@ def handle_form(req) -> FormState:
   )
   
   try:
-    state.rsa_key_size = int(rsa_key_size_raw)
-    if state.rsa_key_size < 512:
-      state.rsa_key_size = 512
-    elif state.rsa_key_size > 4096:
-      state.rsa_key_size = 4096
+    state.rsa_key_size = rsa_normalize_key_size(int(rsa_key_size_raw))
   except ValueError:
     state.rsa_key_size = 2048
   
   try:
-    state.dsa_key_size = int(dsa_key_size_raw)
-    if state.dsa_key_size < 1024:
-      state.dsa_key_size = 1024
-    elif state.dsa_key_size > 3072:
-      state.dsa_key_size = 3072
-    # DSA için sadece 1024, 2048, 3072 geçerli
-    if state.dsa_key_size not in [1024, 2048, 3072]:
-      if state.dsa_key_size < 1536:
-        state.dsa_key_size = 1024
-      elif state.dsa_key_size < 2560:
-        state.dsa_key_size = 2048
-      else:
-        state.dsa_key_size = 3072
+    state.dsa_key_size = dsa_normalize_key_size(int(dsa_key_size_raw))
   except ValueError:
     state.dsa_key_size = 2048
 
@@ -2551,326 +3288,49 @@ def handle_form(req) -> FormState:
     return state
 
   try:
-    if algorithm == "caesar":
-      if mode == "encrypt":
-        state.output = caesar_encrypt(text, state.caesar_shift)
-        state.status = "Sezar ile şifreleme tamamlandı."
-      else:
-        state.output = caesar_decrypt(text, state.caesar_shift)
-        state.status = "Sezar ile deşifreleme tamamlandı."
-    elif algorithm == "railFence":
-      if mode == "encrypt":
-        state.output = rail_fence_encrypt(text, state.rail_rails)
-        state.status = "Rail Fence ile şifreleme tamamlandı."
-      else:
-        state.output = rail_fence_decrypt(text, state.rail_rails)
-        state.status = "Rail Fence ile deşifreleme tamamlandı."
-    elif algorithm == "vigenere":
-      if not vigenere_key:
-        state.status = "Vigenere için anahtar gereklidir."
-        state.is_error = True
-        return state
-      if mode == "encrypt":
-        state.output = vigenere_encrypt(text, vigenere_key)
-        state.status = "Vigenere ile şifreleme tamamlandı."
-      else:
-        state.output = vigenere_decrypt(text, vigenere_key)
-        state.status = "Vigenere ile deşifreleme tamamlandı."
-    elif algorithm == "vernam":
-      if not vernam_key:
-        state.status = "Vernam için anahtar gereklidir."
-        state.is_error = True
-        return state
-      if mode == "encrypt":
-        state.output = vernam_encrypt(text, vernam_key)
-        state.status = "Vernam ile şifreleme tamamlandı."
-      else:
-        state.output = vernam_decrypt(text, vernam_key)
-        state.status = "Vernam ile deşifreleme tamamlandı."
-    elif algorithm == "playfair":
-      if not playfair_key:
-        state.status = "Playfair için anahtar gereklidir."
-        state.is_error = True
-        return state
-      if mode == "encrypt":
-        state.output = playfair_encrypt(text, playfair_key)
-        state.status = "Playfair ile şifreleme tamamlandı."
-      else:
-        state.output = playfair_decrypt(text, playfair_key)
-        state.status = "Playfair ile deşifreleme tamamlandı."
-    elif algorithm == "route":
-      if mode == "encrypt":
-        state.output = route_encrypt(text, state.route_rows, state.route_cols)
-        state.status = "Route ile şifreleme tamamlandı."
-      else:
-        state.output = route_decrypt(text, state.route_rows, state.route_cols)
-        state.status = "Route ile deşifreleme tamamlandı."
-    elif algorithm == "affine":
-      try:
-        if mode == "encrypt":
-          state.output = affine_encrypt(text, state.affine_a, state.affine_b)
-          state.status = "Affine ile şifreleme tamamlandı."
-        else:
-          state.output = affine_decrypt(text, state.affine_a, state.affine_b)
-          state.status = "Affine ile deşifreleme tamamlandı."
-      except ValueError as e:
-        state.status = f"Affine hatası: {str(e)}"
-        state.is_error = True
-    elif algorithm == "hill":
-      if not hill_key:
-        state.status = "Hill Cipher için anahtar gereklidir."
+    cipher = CLASSIC_CIPHERS.get(algorithm)
+    if cipher is not None:
+      # Anahtar gerektiren algoritmalarda anahtar boş olamaz
+      if cipher.key_field and not getattr(state, cipher.key_field):
+        state.status = f"{cipher.label} için anahtar gereklidir."
         state.is_error = True
         return state
       try:
+        state.output = classic_cached_run(algorithm, mode, text, cipher.params(state))
         if mode == "encrypt":
-          state.output = hill_encrypt(text, hill_key, state.hill_size)
-          state.status = "Hill Cipher ile şifreleme tamamlandı."
-        else:
-          state.output = hill_decrypt(text, hill_key, state.hill_size)
-          state.status = "Hill Cipher ile deşifreleme tamamlandı."
-      except ValueError as e:
-        state.status = f"Hill Cipher hatası: {str(e)}"
-        state.is_error = True
-    elif algorithm == "columnar":
-      if not columnar_key:
-        state.status = "Columnar için anahtar gereklidir."
-        state.is_error = True
-        return state
-      if mode == "encrypt":
-        state.output = columnar_encrypt(text, columnar_key)
-        state.status = "Columnar ile şifreleme tamamlandı."
-      else:
-        state.output = columnar_decrypt(text, columnar_key)
-        state.status = "Columnar ile deşifreleme tamamlandı."
-    elif algorithm == "aes":
-      if not aes_key:
-        state.status = "AES için anahtar gereklidir."
-        state.is_error = True
-        return state
-      try:
-        # Zaman ölçümü başlat
-        start_time = time.perf_counter()
-        
-        if state.aes_use_library:
-          if mode == "encrypt":
-            state.output = aes_library_encrypt(text, aes_key)
-            method_type = "kütüphaneli"
-            operation = "şifreleme"
-          else:
-            state.output = aes_library_decrypt(text, aes_key)
-            method_type = "kütüphaneli"
-            operation = "deşifreleme"
+          state.status = f"{cipher.label} ile şifreleme tamamlandı."
         else:
-          if mode == "encrypt":
-            state.output = aes_manual_encrypt(text, aes_key)
-            method_type = "kütüphanesiz"
-            operation = "şifreleme"
-          else:
-            state.output = aes_manual_decrypt(text, aes_key)
-            method_type = "kütüphanesiz"
-            operation = "deşifreleme"
-        
-        # Zaman ölçümü bitir
-        end_time = time.perf_counter()
-        elapsed_time = (end_time - start_time) * 1000  # milisaniyeye çevir
-        
-        state.status = f"AES ({method_type}) ile {operation} tamamlandı. Süre: {elapsed_time:.3f} ms"
+          state.status = f"{cipher.label} ile deşifreleme tamamlandı."
       except ValueError as e:
-        state.status = f"AES hatası: {str(e)}"
+        state.status = f"{cipher.label} hatası: {str(e)}"
         state.is_error = True
-    elif algorithm == "des":
-      if not des_key:
-        state.status = "DES için anahtar gereklidir (8 karakter)."
+    elif algorithm in MODERN_CIPHERS:
+      modern = MODERN_CIPHERS[algorithm]
+      use_library = modern.manual is None or getattr(state, modern.use_library_field)
+      encrypt_op, decrypt_op = modern.library if use_library else modern.manual
+      operation = encrypt_op if mode == "encrypt" else decrypt_op
+      method_type = modern.library_label if use_library else "kütüphanesiz"
+      
+      if not getattr(state, operation.key_field) and operation.generate_keys is None:
+        state.status = operation.missing_key
         state.is_error = True
         return state
       try:
         # Zaman ölçümü başlat
         start_time = time.perf_counter()
         
-        if state.des_use_library:
-          if mode == "encrypt":
-            state.output = des_library_encrypt(text, des_key)
-            method_type = "kütüphaneli"
-            operation = "şifreleme"
-          else:
-            state.output = des_library_decrypt(text, des_key)
-            method_type = "kütüphaneli"
-            operation = "deşifreleme"
-        else:
-          if mode == "encrypt":
-            state.output = des_manual_encrypt(text, des_key)
-            method_type = "kütüphanesiz"
-            operation = "şifreleme"
-          else:
-            state.output = des_manual_decrypt(text, des_key)
-            method_type = "kütüphanesiz"
-            operation = "deşifreleme"
-        
-        # Zaman ölçümü bitir
-        end_time = time.perf_counter()
-        elapsed_time = (end_time - start_time) * 1000  # milisaniyeye çevir
-        
-        state.status = f"DES ({method_type}) ile {operation} tamamlandı. Süre: {elapsed_time:.3f} ms"
-      except ValueError as e:
-        state.status = f"DES hatası: {str(e)}"
-        state.is_error = True
-    elif algorithm == "rsa":
-      try:
-        # Zaman ölçümü başlat
-        start_time = time.perf_counter()
-        
-        if mode == "encrypt":
-          if not rsa_public_key:
-            state.status = "RSA şifreleme için public key gereklidir. Anahtar oluştur butonuna basın."
-            state.is_error = True
-            return state
-          state.output = rsa_library_encrypt(text, rsa_public_key)
-          operation = "şifreleme"
-        else:
-          if not rsa_private_key:
-            state.status = "RSA deşifreleme için private key gereklidir."
-            state.is_error = True
-            return state
-          state.output = rsa_library_decrypt(text, rsa_private_key)
-          operation = "deşifreleme"
-        
-        # Zaman ölçümü bitir
-        end_time = time.perf_counter()
-        elapsed_time = (end_time - start_time) * 1000  # milisaniyeye çevir
-        
-        state.status = f"RSA (kütüphaneli) ile {operation} tamamlandı. Süre: {elapsed_time:.3f} ms"
-      except ValueError as e:
-        state.status = f"RSA hatası: {str(e)}"
-        state.is_error = True
-      except Exception as e:
-        state.status = f"RSA hatası: {str(e)}"
-        state.is_error = True
-    elif algorithm == "dsa":
-      try:
-        # Zaman ölçümü başlat
-        start_time = time.perf_counter()
-        
-        if state.dsa_use_library:
-          if mode == "encrypt":
-            # DSA encrypt = dijital imza oluştur
-            if not dsa_private_key:
-              state.status = "DSA imza oluşturma için private key gereklidir. Anahtar oluştur butonuna basın."
-              state.is_error = True
-              return state
-            state.output = dsa_library_sign(text, dsa_private_key)
-            method_type = "kütüphaneli"
-            operation = "imza oluşturma"
-          else:
-            # DSA decrypt = dijital imza doğrula
-            if not dsa_public_key:
-              state.status = "DSA imza doğrulama için public key gereklidir."
-              state.is_error = True
-              return state
-            state.output = dsa_library_verify(text, dsa_public_key)
-            method_type = "kütüphaneli"
-            operation = "imza doğrulama"
-        else:
-          if mode == "encrypt":
-            # DSA imza oluştur
-            if not dsa_private_key:
-              # Anahtar oluştur
-              pub_key_dict, priv_key_dict = dsa_manual_generate_keys(state.dsa_key_size)
-              # Dictionary'yi JSON benzeri string'e çevir
-              import json
-              state.dsa_public_key = json.dumps(pub_key_dict)
-              state.dsa_private_key = json.dumps(priv_key_dict)
-              priv_key = priv_key_dict
-            else:
-              # String'den dict'e çevir
-              import json
-              priv_key = json.loads(dsa_private_key)
-            state.output = dsa_manual_sign(text, priv_key)
-            method_type = "kütüphanesiz"
-            operation = "imza oluşturma"
-          else:
-            # DSA imza doğrula
-            if not dsa_public_key:
-              state.status = "DSA imza doğrulama için public key gereklidir."
-              state.is_error = True
-              return state
-            # String'den dict'e çevir
-            import json
-            pub_key = json.loads(dsa_public_key)
-            state.output = dsa_manual_verify(text, pub_key)
-            method_type = "kütüphanesiz"
-            operation = "imza doğrulama"
-        
-        # Zaman ölçümü bitir
-        end_time = time.perf_counter()
-        elapsed_time = (end_time - start_time) * 1000  # milisaniyeye çevir
-        
-        state.status = f"DSA ({method_type}) ile {operation} tamamlandı. Süre: {elapsed_time:.3f} ms"
-      except ValueError as e:
-        state.status = f"DSA hatası: {str(e)}"
-        state.is_error = True
-      except Exception as e:
-        state.status = f"DSA hatası: {str(e)}"
-        state.is_error = True
-    elif algorithm == "ecc":
-      try:
-        # Zaman ölçümü başlat
-        start_time = time.perf_counter()
-        
-        if state.ecc_use_library:
-          if mode == "encrypt":
-            if not ecc_public_key:
-              state.status = "ECC şifreleme için public key gereklidir. Anahtar oluştur butonuna basın."
-              state.is_error = True
-              return state
-            state.output = ecc_library_encrypt(text, ecc_public_key)
-            method_type = "kütüphaneli"
-            operation = "şifreleme"
-          else:
-            if not ecc_private_key:
-              state.status = "ECC deşifreleme için private key gereklidir."
-              state.is_error = True
-              return state
-            state.output = ecc_library_decrypt(text, ecc_private_key)
-            method_type = "kütüphaneli"
-            operation = "deşifreleme"
-        else:
-          if mode == "encrypt":
-            if not ecc_public_key:
-              # Anahtar oluştur
-              pub_key_dict, priv_key_dict = ecc_manual_generate_keys()
-              import json
-              state.ecc_public_key = json.dumps(pub_key_dict)
-              state.ecc_private_key = json.dumps(priv_key_dict)
-              pub_key = pub_key_dict
-            else:
-              # String'den dict'e çevir
-              import json
-              pub_key = json.loads(ecc_public_key)
-            state.output = ecc_manual_encrypt(text, pub_key)
-            method_type = "kütüphanesiz"
-            operation = "şifreleme"
-          else:
-            if not ecc_private_key:
-              state.status = "ECC deşifreleme için private key gereklidir."
-              state.is_error = True
-              return state
-            # String'den dict'e çevir
-            import json
-            priv_key = json.loads(ecc_private_key)
-            state.output = ecc_manual_decrypt(text, priv_key)
-            method_type = "kütüphanesiz"
-            operation = "deşifreleme"
+        # Kütüphanesiz DSA/ECC'de anahtar yoksa yeni anahtar üretilir
+        if not getattr(state, operation.key_field):
+          operation.generate_keys(state)
+        state.output = operation.run(text, getattr(state, operation.key_field))
         
         # Zaman ölçümü bitir
         end_time = time.perf_counter()
         elapsed_time = (end_time - start_time) * 1000  # milisaniyeye çevir
         
-        state.status = f"ECC ({method_type}) ile {operation} tamamlandı. Süre: {elapsed_time:.3f} ms"
-      except ValueError as e:
-        state.status = f"ECC hatası: {str(e)}"
-        state.is_error = True
+        state.status = f"{modern.label} ({method_type}) ile {operation.name} tamamlandı. Süre: {elapsed_time:.3f} ms"
       except Exception as e:
-        state.status = f"ECC hatası: {str(e)}"
+        state.status = f"{modern.label} hatası: {str(e)}"
         state.is_error = True
     else:
       state.status = "Bilinmeyen algoritma seçildi."
@@ -2894,7 +3354,6 @@ def generate_rsa_keys():
     JSON response: {public_key, private_key} veya {error}
   """
   """RSA anahtar çifti oluşturur (sadece kütüphaneli)"""
-  from flask import jsonify
   try:
     key_size = int(request.form.get("keySize", "2048"))
     
@@ -2921,23 +3380,12 @@ def generate_dsa_keys():
     JSON response: {public_key, private_key} veya {error}
   """
   """DSA anahtar çifti oluşturur"""
-  from flask import jsonify
   try:
     key_size = int(request.form.get("keySize", "2048"))
     use_library = request.form.get("useLibrary", "true").lower() == "true"
     
     # DSA key_size düzelt
-    if key_size < 1024:
-      key_size = 1024
-    elif key_size > 3072:
-      key_size = 3072
-    if key_size not in [1024, 2048, 3072]:
-      if key_size < 1536:
-        key_size = 1024
-      elif key_size < 2560:
-        key_size = 2048
-      else:
-        key_size = 3072
+    key_size = dsa_normalize_key_size(key_size)
     
     if use_library:
       public_key, private_key = dsa_library_generate_keys(key_size)
@@ -2948,11 +3396,10 @@ def generate_dsa_keys():
       })
     else:
       pub_key_dict, priv_key_dict = dsa_manual_generate_keys(key_size)
-      import json
       return jsonify({
         "success": True,
-        "public_key": json.dumps(pub_key_dict),
-        "private_key": json.dumps(priv_key_dict)
+        "public_key": json.dumps(pub_key_dict._asdict()),
+        "private_key": json.dumps(priv_key_dict._asdict())
       })
   except Exception as e:
     return jsonify({"success": False, "error": str(e)})
@@ -2973,7 +3420,6 @@ def generate_ecc_keys():
     JSON response: {public_key, private_key, curve} veya {error}
   """
   """ECC anahtar çifti oluşturur"""
-  from flask import jsonify
   try:
     curve_name = request.form.get("curveName", "P-256")
     use_library = request.form.get("useLibrary", "true").lower() == "true"
@@ -2987,7 +3433,6 @@ def generate_ecc_keys():
       })
     else:
       pub_key_dict, priv_key_dict = ecc_manual_generate_keys()
-      import json
       return jsonify({
         "success": True,
         "public_key": json.dumps(pub_key_dict),